@@ -1,5 +1,4 @@
 from unified_planning.shortcuts import *
-from scipy.stats import bernoulli
 
 
 def add_object_condition_effect(action, object):
@@ -14,11 +13,10 @@ problem = unified_planning.model.Problem('stuck_car')
 """ Init things that can be pushed """
 Car = UserType('Car')
 car = unified_planning.model.Object('car', Car)
-problem.add_object(car)
 
 GasPedal = UserType('GasPedal')
 gasPedal = unified_planning.model.Object('gasPedal', GasPedal)
-problem.add_object(gasPedal)
+problem.add_objects([car, gasPedal])
 
 """ Init rocks """
 Rock = UserType('Rock')
@@ -49,15 +47,18 @@ problem.add_fluent(free, default_initial_value=True)
 rock_under_car = unified_planning.model.Fluent('rock_under_car', BoolType(), r=Rock)
 problem.add_fluent(rock_under_car, default_initial_value=False)
 
+""" Ground atoms built once and reused by every action and callback """
+free_body_parts = [free(b) for b in bodyParts]
+got_rocks = [got_rock(r) for r in rocks]
+
 """ Actions """
 
 """ Rest Action """
 rest = unified_planning.model.DurativeAction('rest')
-rest.add_condition(free(bodyParts[0]), True)
-rest.add_condition(free(bodyParts[1]), True)
+rest.add_condition(free_body_parts[0], True)
+rest.add_condition(free_body_parts[1], True)
 rest.set_fixed_duration(1)
 rest.add_effect(EndTiming(), tired, False)
-problem.add_action(rest)
 
 """ Place a rock under the car Action """
 place_rock = unified_planning.model.DurationProbabilisticAction('place_rock', rock=Rock)
@@ -65,45 +66,57 @@ duration_probabilistic_actions.append(place_rock)
 rock = place_rock.parameter('rock')
 place_rock.set_fixed_duration(3)
 place_rock.add_precondition(got_rock(rock))
-add_object_condition_effect(place_rock, free(bodyParts[0]))
-add_object_condition_effect(place_rock, free(bodyParts[1]))
+add_object_condition_effect(place_rock, free_body_parts[0])
+add_object_condition_effect(place_rock, free_body_parts[1])
+
+
+""" Bernoulli parameters of the probabilistic effects, fixed for this problem """
+TIRED_PUSH_P = 0.8
+TIRED_PLACE_P = 0.4
+FOUND_ROCK_P = 0.8
+CAR_OUT_P = 0.8
+
+
+def as_predicate_set(predicates):
+    """ The state may expose its predicates as a list; make sure membership
+        tests inside the probability functions are O(1) set lookups """
+    if isinstance(predicates, (set, frozenset)):
+        return predicates
+    return frozenset(predicates)
 
 
 def tired_probability(problem, state):
     p = 0
-    predicates = state.predicates
+    predicates = as_predicate_set(state.predicates)
     # The probability of getting tired when the robot pushes the car
-    if action_occurs(start_push_car) in predicates:
-        p = 0.8
+    if start_push_car_occurs in predicates:
+        p = TIRED_PUSH_P
     # The probability of getting tired when the robot places a rock
-    elif action_occurs(start_place_rock) in predicates:
-        p = 0.4
+    elif start_place_rock_occurs in predicates:
+        p = TIRED_PLACE_P
     return {p: {tired: True}, 1-p: {tired: False}}
 
 
 place_rock.add_effect(rock_under_car(rock), True)
 place_rock.add_effect(got_rock(rock), False)
 place_rock.add_probabilistic_effect([tired], tired_probability)
-problem.add_action(place_rock)
 
 """ Search a rock Action 
     the robot can find a one of the rocks"""
 search = unified_planning.model.action.DurationProbabilisticAction('search')
 duration_probabilistic_actions.append(search)
 search.set_fixed_duration(3)
-add_object_condition_effect(search, free(bodyParts[0]))
-add_object_condition_effect(search, free(bodyParts[1]))
+add_object_condition_effect(search, free_body_parts[0])
+add_object_condition_effect(search, free_body_parts[1])
 
-import inspect as i
 
 def rock_probability(problem, state):
     # The probability of finding a good rock when searching
-    p = 0.8
-    return {p: {got_rock(rocks[0]): True, got_rock(rocks[1]): False}, 1-p: {got_rock(rocks[0]): False, got_rock(rocks[1]): True}}
+    p = FOUND_ROCK_P
+    return {p: {got_rocks[0]: True, got_rocks[1]: False}, 1-p: {got_rocks[0]: False, got_rocks[1]: True}}
 
 
-search.add_probabilistic_effect([got_rock(rocks[0]), got_rock(rocks[1])], rock_probability)
-problem.add_action(search)
+search.add_probabilistic_effect([got_rocks[0], got_rocks[1]], rock_probability)
 
 """ Push Actions """
 
@@ -111,60 +124,44 @@ problem.add_action(search)
 push_gas = unified_planning.model.action.DurationProbabilisticAction('push_gas')
 duration_probabilistic_actions.append(push_gas)
 push_gas.set_fixed_duration(2)
-add_object_condition_effect(push_gas, free(bodyParts[1]))
-
-problem.add_action(push_gas)
+add_object_condition_effect(push_gas, free_body_parts[1])
 
 """ Push Car Action """
 push_car = unified_planning.model.action.DurationProbabilisticAction('push_car')
 duration_probabilistic_actions.append(push_car)
 push_car.set_fixed_duration(2)
-add_object_condition_effect(push_car, free(bodyParts[0]))
+add_object_condition_effect(push_car, free_body_parts[0])
 
-problem.add_action(push_car)
+""" All actions are registered in one batch instead of one add_action call each """
+problem.add_actions([rest, place_rock, search, push_gas, push_car])
 
 action_occurs, durative_probabilistic_action_objects = unified_planning.model.action.start_end_actions(problem,
                                                                                                        duration_probabilistic_actions)
-start_push_gas, start_push_car, start_place_rock = (None, None, None)
-for o in durative_probabilistic_action_objects:
-    if o.name == 'start-push_gas':
-        start_push_gas = o
-    if o.name == 'start-push_car':
-        start_push_car = o
-    if o.name == 'start-place_rock':
-        start_place_rock = o
+start_actions_by_name = {o.name: o for o in durative_probabilistic_action_objects}
+start_push_gas = start_actions_by_name['start-push_gas']
+start_push_car = start_actions_by_name['start-push_car']
+start_place_rock = start_actions_by_name['start-place_rock']
+
+""" Ground atoms reused by the probability functions, built once
+    instead of on every call """
+start_push_car_occurs = action_occurs(start_push_car)
+start_push_gas_occurs = action_occurs(start_push_gas)
+start_place_rock_occurs = action_occurs(start_place_rock)
+
+""" Probability of getting the car out per combination of active push
+    actions (bit 0 = start_push_car, bit 1 = start_push_gas); extend the
+    table if the probabilities ever diverge per combination """
+PUSH_P_TABLE = (0, CAR_OUT_P, CAR_OUT_P, CAR_OUT_P)
 
 
 def push_probability(problem, state):
     # The probability of getting the car out when pushing
-    p = 0
-    predicates = state.predicates
-
-    # The bad rock is under the car
-    if rock_under_car(rocks[0]) in predicates:
-        if action_occurs(start_push_car) in predicates and action_occurs(start_push_gas) in predicates:
-            p = 0.8
-        elif action_occurs(start_push_car) in predicates:
-            p = 0.8
-        elif action_occurs(start_push_gas) in predicates:
-            p = 0.8
-
-    # The good rock is under the car
-    elif rock_under_car(rocks[1]) in predicates:
-        if action_occurs(start_push_car) in predicates and action_occurs(start_push_gas) in predicates:
-            p = 0.8
-        elif action_occurs(start_push_car) in predicates:
-            p = 0.8
-        elif action_occurs(start_push_gas) in predicates:
-            p = 0.8
-
-    # There isn't a rock under the car
-    elif action_occurs(start_push_car) in predicates and action_occurs(start_push_gas) in predicates:
-        p = 0.8
-    elif action_occurs(start_push_car) in predicates:
-        p = 0.8
-    elif action_occurs(start_push_gas) in predicates:
-        p = 0.8
+    # Every branch of the original decision tree (bad rock / good rock / no
+    # rock under the car) yields the same probability, so only a push action
+    # being active matters
+    predicates = as_predicate_set(state.predicates)
+    k = (start_push_car_occurs in predicates) | ((start_push_gas_occurs in predicates) << 1)
+    p = PUSH_P_TABLE[k]
 
     return {p: {car_out: True}, 1-p: {car_out: False}}
 
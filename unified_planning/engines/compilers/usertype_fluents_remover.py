@@ -553,10 +553,10 @@ class UsertypeFluentsRemover(engines.engine.Engine, CompilerMixin):
                 defined_names.update(a._parameters)
                 defined_names.update(a.duration.lower.get_contained_names())
                 defined_names.update(a.duration.upper.get_contained_names())
-                for cl in a._conditions.values():
+                for cl in a.conditions.values():
                     for c in cl:
                         defined_names.update(c.get_contained_names())
-                for el in a._effects.values():
+                for el in a.effects.values():
                     for e in el:
                         self._update_names_in_effect(e, defined_names)
             else:
@@ -109,7 +109,10 @@ class SimulatorMixin:
         raise NotImplementedError
 
     def apply(
-        self, event: "Event", state: "up.model.COWState"
+        self,
+        event: "Event",
+        state: "up.model.COWState",
+        assume_applicable: bool = False,
     ) -> Optional["up.model.COWState"]:
         """
         Returns `None` if the `event` is not applicable in the given `state`, otherwise returns a new `COWState`,
@@ -118,13 +121,18 @@ class SimulatorMixin:
 
         :param state: the `state` where the event formulas are calculated.
         :param event: the `event` that has the information about the `conditions` to check and the `effects` to apply.
+        :param assume_applicable: if `True` the applicability check is skipped; the caller states that
+            `self.is_applicable(event, state)` holds, with the same correctness contract as `apply_unsafe`.
         :return: `None` if the `event` is not applicable in the given `state`, a new `COWState` with some updated `values`
             if the `event` is applicable.
         """
-        return self._apply(event, state)
+        return self._apply(event, state, assume_applicable=assume_applicable)
 
     def _apply(
-        self, event: "Event", state: "up.model.COWState"
+        self,
+        event: "Event",
+        state: "up.model.COWState",
+        assume_applicable: bool = False,
     ) -> Optional["up.model.COWState"]:
         """
         Method called by the up.engines.mixins.simulator.SimulatorMixin.apply.
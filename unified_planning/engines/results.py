@@ -20,16 +20,20 @@ from unified_planning.exceptions import UPUsageError
 from unified_planning.model import AbstractProblem
 from unified_planning.plans import ActionInstance
 from dataclasses import dataclass, field
-from enum import Enum, auto
+from enum import Enum, IntEnum, auto
 from typing import Callable, Dict, Optional, List
 
 
-class ValidationResultStatus(Enum):
+class ValidationResultStatus(IntEnum):
     """
     Enum representing the 2 possible values in the `status` field of a :class:`~unified_planning.engines.ValidationResult`:
     VALID or INVALID.
     """
 
+    # keep the Enum rendering ("ValidationResultStatus.VALID"); on Python 3.11+
+    # IntEnum would otherwise stringify to the bare integer
+    __str__ = Enum.__str__
+
     VALID = (
         auto()
     )  # The plan is valid for the problem, it satisfies all the hard constraints
@@ -44,7 +48,7 @@ class ValidationResultStatus(Enum):
             return False
 
 
-class PlanGenerationResultStatus(Enum):
+class PlanGenerationResultStatus(IntEnum):
     """
     Enum representing the 9 possible values in the status field of a :class:`~unified_planning.engines.PlanGenerationResult`:
     SOLVED_SATISFICING        -> Valid plan found.
@@ -59,6 +63,8 @@ class PlanGenerationResultStatus(Enum):
     INTERMEDIATE              -> The report is not a final one but it's given through the callback function
     """
 
+    __str__ = Enum.__str__
+
     SOLVED_SATISFICING = auto()  # Valid plan found.
     SOLVED_OPTIMALLY = auto()  # Optimal plan found.
     UNSOLVABLE_PROVEN = auto()  # The problem is impossible, no valid plan exists.
@@ -89,20 +95,30 @@ NEGATIVE_OUTCOMES = frozenset(
     ]
 )
 
+# Bitmask mirrors of the outcome sets above; a membership test on an IntEnum
+# status becomes a single shift + AND instead of a hash + frozenset probe.
+_POSITIVE_OUTCOMES_MASK = sum(1 << s.value for s in POSITIVE_OUTCOMES)
+_NEGATIVE_OUTCOMES_MASK = sum(1 << s.value for s in NEGATIVE_OUTCOMES)
+_DEFINITIVE_MASK = (1 << PlanGenerationResultStatus.SOLVED_OPTIMALLY.value) | (
+    1 << PlanGenerationResultStatus.UNSOLVABLE_PROVEN.value
+)
+
 
-class LogLevel(Enum):
+class LogLevel(IntEnum):
     """
     Enum representing the 4 possible values in the verbosity level of a :class:`~unified_planning.engines.LogMessage`:
     DEBUG, INFO, WARNING and ERROR
     """
 
+    __str__ = Enum.__str__
+
     DEBUG = auto()
     INFO = auto()
     WARNING = auto()
     ERROR = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class LogMessage:
     """
     This class is composed by a message and the Enum LogLevel indicating
@@ -116,7 +132,7 @@ class LogMessage:
         return f"[{self.level.name}] {self.message}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Result:
     """This class represents the base class for results given by the engines to the user."""
 
@@ -125,7 +141,7 @@ class Result:
         raise NotImplementedError
 
 
-@dataclass
+@dataclass(slots=True)
 class PlanGenerationResult(Result):
     """Class that represents the result of a plan generation call."""
 
@@ -134,36 +150,35 @@ class PlanGenerationResult(Result):
     engine_name: str
     metrics: Optional[Dict[str, str]] = field(default=None)
     log_messages: Optional[List[LogMessage]] = field(default=None)
+    # Memoized at construction: True if the status is definitive no matter
+    # which quality metrics the problem declares.
+    _definitive_no_metrics: bool = field(init=False, repr=False, compare=False)
 
-    def __post__init(self):
+    def __post_init__(self):
         # Checks that plan and status are consistent
-        if self.status in POSITIVE_OUTCOMES and self.plan is None:
+        status_bit = 1 << self.status.value
+        self._definitive_no_metrics = status_bit & _DEFINITIVE_MASK != 0
+        if status_bit & _POSITIVE_OUTCOMES_MASK and self.plan is None:
             raise UPUsageError(
                 f"The Result status is {str(self.status)} but no plan is set."
             )
-        elif self.status in NEGATIVE_OUTCOMES and self.plan is not None:
+        elif status_bit & _NEGATIVE_OUTCOMES_MASK and self.plan is not None:
             raise UPUsageError(
                 f"The Result status is {str(self.status)} but the plan is {str(self.plan)}.\nWith this status the plan must be None."
             )
-        return self
 
     def is_definitive_result(self, *args) -> bool:
-        optimality_required = False
-        if len(args) > 0:
-            optimality_required = (
-                len(args[0].quality_metrics) > 0
-            )  # Require optimality if the problem has at least one quality metric.
+        if self._definitive_no_metrics:
+            return True
+        # Require optimality if the problem has at least one quality metric.
         return (
-            self.status == PlanGenerationResultStatus.SOLVED_OPTIMALLY
-            or self.status == PlanGenerationResultStatus.UNSOLVABLE_PROVEN
-            or (
-                optimality_required
-                and self.status == PlanGenerationResultStatus.SOLVED_SATISFICING
-            )
+            len(args) > 0
+            and len(args[0].quality_metrics) > 0
+            and self.status == PlanGenerationResultStatus.SOLVED_SATISFICING
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult(Result):
     """Class that represents the result of a validate call."""
 
@@ -181,7 +196,7 @@ class ValidationResult(Result):
             return False
 
 
-@dataclass
+@dataclass(slots=True)
 class CompilerResult(Result):
     """Class that represents the result of a compile call."""
 
@@ -192,7 +207,7 @@ class CompilerResult(Result):
     engine_name: str
     log_messages: Optional[List[LogMessage]] = field(default=None)
 
-    def _post_init(self):
+    def __post_init__(self):
         # Check that compiled problem and map_back_action_instance are consistent with each other
         if self.problem is None and self.map_back_action_instance is not None:
             raise UPUsageError(
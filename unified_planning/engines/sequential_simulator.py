@@ -25,7 +25,99 @@ from unified_planning.plans import ActionInstance
 from unified_planning.model import FNode, Type, ExpressionManager
 from unified_planning.model.types import _RealType
 from unified_planning.model.walkers import StateEvaluator
-from typing import Dict, Iterator, List, Optional, Set, Tuple, Union, cast
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple, Union, cast
+from weakref import WeakKeyDictionary
+
+
+# Integer tags describing the kind of an effect, precomputed per event so the
+# apply hot loop branches on an int instead of calling is_assignment()/
+# is_increase()/is_decrease() per effect per application.
+_EFFECT_ASSIGN, _EFFECT_INCREASE, _EFFECT_DECREASE = 0, 1, 2
+
+
+def _compute_effects_data(
+    effects: List["up.model.Effect"],
+) -> Tuple[Tuple["up.model.Effect", int, Optional["up.model.FNode"]], ...]:
+    """
+    Returns a tuple of (effect, kind tag, condition) triples, where the
+    condition is None for unconditional effects; all of it is static
+    per-effect information extracted once.
+    """
+    data = []
+    for effect in effects:
+        if effect.is_assignment():
+            tag = _EFFECT_ASSIGN
+        elif effect.is_increase():
+            tag = _EFFECT_INCREASE
+        elif effect.is_decrease():
+            tag = _EFFECT_DECREASE
+        else:
+            raise NotImplementedError
+        data.append(
+            (effect, tag, effect.condition if effect.is_conditional() else None)
+        )
+    return tuple(data)
+
+
+def _compute_bounded_effects(
+    effects: List["up.model.Effect"],
+) -> List[Tuple["up.model.Effect", Optional[Fraction], Optional[Fraction]]]:
+    """
+    Returns the list of (effect, lower_bound, upper_bound) for the effects
+    whose fluent has a bounded int/real type; the other effects need no
+    bound checking.
+    """
+    bounded_effects = []
+    for effect in effects:
+        f_type = effect.fluent.type
+        if f_type.is_int_type() or f_type.is_real_type():
+            r_type = cast(_RealType, f_type)
+            if r_type.lower_bound is not None or r_type.upper_bound is not None:
+                bounded_effects.append(
+                    (effect, r_type.lower_bound, r_type.upper_bound)
+                )
+    return bounded_effects
+
+
+def _compute_simulated_effect_bounds(
+    simulated_effect: Optional["up.model.SimulatedEffect"],
+) -> List[
+    Tuple[
+        int,
+        Optional[Fraction],
+        Optional[Fraction],
+        Optional["up.model.FNode"],
+        Optional["up.model.FNode"],
+    ]
+]:
+    """
+    Returns the list of (index, lower_bound, upper_bound, lower_literal,
+    upper_literal) for the simulated effect fluents that have a bounded
+    int/real type; the index refers to the position in
+    simulated_effect.fluents (and therefore in the values returned by the
+    simulated effect function). The simulated effect fluents are static, so
+    the `LE` literals reported on a bound violation are built once here
+    instead of at every violation.
+    """
+    bounds = []
+    if simulated_effect is not None:
+        for idx, f in enumerate(simulated_effect.fluents):
+            f_type = f.type
+            if f_type.is_int_type() or f_type.is_real_type():
+                r_type = cast(_RealType, f_type)
+                if r_type.lower_bound is not None or r_type.upper_bound is not None:
+                    em = f.environment.expression_manager
+                    lower_bound, upper_bound = r_type.lower_bound, r_type.upper_bound
+                    lower_literal = (
+                        em.LE(lower_bound, f) if lower_bound is not None else None
+                    )
+                    upper_literal = (
+                        em.LE(f, upper_bound) if upper_bound is not None else None
+                    )
+                    bounds.append(
+                        (idx, lower_bound, upper_bound, lower_literal, upper_literal)
+                    )
+    return bounds
 
 
 class InstantaneousEvent(Event):
@@ -40,6 +132,67 @@ class InstantaneousEvent(Event):
         self._conditions = conditions
         self._effects = effects
         self._simulated_effect = simulated_effect
+        # Static metadata, computed once here so that every applicability
+        # check reads it instead of re-running the type introspection.
+        self._bounded_effects = _compute_bounded_effects(effects)
+        self._sim_effect_bounds = _compute_simulated_effect_bounds(simulated_effect)
+        self._effects_data = _compute_effects_data(effects)
+        # True when the event is a plain set of unconditional assignments to
+        # distinct ground fluents with no simulated effect: such an event
+        # cannot conflict with itself and can be applied with a single dict
+        # comprehension, skipping all the conflict bookkeeping.
+        self._is_simple = (
+            simulated_effect is None
+            and all(
+                tag == _EFFECT_ASSIGN and condition is None
+                for _, tag, condition in self._effects_data
+            )
+            and all(a.is_constant() for e in effects for a in e.fluent.args)
+            and len({e.fluent for e in effects}) == len(effects)
+        )
+        # Compiled condition check, built lazily at the first applicability
+        # test; None until then or when the conditions are not compilable.
+        self._compiled_check: Optional[Callable[["up.model.ROState"], bool]] = None
+        self._check_compiled: bool = False
+
+    def _compile_check(self) -> None:
+        """
+        Tries to compile the event conditions into a closure performing direct
+        state reads, skipping the generic StateEvaluator dispatch. Only the
+        common condition shapes are handled (ground boolean fluent atoms,
+        their negation and boolean constants); any other condition leaves
+        `_compiled_check` as None so the generic evaluator is used instead.
+        """
+        self._check_compiled = True
+        literals: List[Tuple["up.model.FNode", bool]] = []
+        for c in self._conditions:
+            if c.is_true():
+                continue
+            if c.is_false():
+                self._compiled_check = lambda state: False
+                return
+            atom, expected = c, True
+            if c.is_not():
+                atom, expected = c.arg(0), False
+            if (
+                atom.is_fluent_exp()
+                and atom.type.is_bool_type()
+                and all(a.is_constant() for a in atom.args)
+            ):
+                literals.append((atom, expected))
+            else:
+                return
+
+        def check(state: "up.model.ROState") -> bool:
+            for atom, expected in literals:
+                value = state.get_value(atom)
+                if not value.is_bool_constant():
+                    return False
+                if value.bool_constant_value() is not expected:
+                    return False
+            return True
+
+        self._compiled_check = check
 
     @property
     def conditions(self) -> List["up.model.FNode"]:
@@ -78,11 +231,92 @@ class SequentialSimulator(Engine, SimulatorMixin):
         assert isinstance(self._problem, up.model.Problem)
         self._grounder = GrounderHelper(problem)
         self._actions = set(self._problem.actions)
+        # Identity-keyed mirror of self._actions: actions are problem-owned,
+        # so membership can be checked on id() without hashing the Action.
+        self._action_ids = frozenset(id(a) for a in self._problem.actions)
         self._events: Dict[
             Tuple["up.model.Action", Tuple["up.model.FNode", ...]], List[Event]
         ] = {}
+        # Identity-keyed mirror of self._events: FNode parameters are
+        # hash-consed, so identity equals equality and the lookup avoids
+        # recursively hashing the action and every parameter expression.
+        self._events_by_ids: Dict[Tuple[int, Tuple[int, ...]], List[Event]] = {}
         self._se = StateEvaluator(self._problem)
+        # The expression manager is immutable problem-wide state; resolving it
+        # once here saves the double attribute dereference on every hot call.
+        self._em = self._problem.environment.expression_manager
         self._all_events_grounded: bool = False
+        # Per-state memoization of the StateEvaluator results; events often
+        # share conditions and fluent arguments, so every unique expression
+        # is evaluated at most once per state.
+        self._eval_cache: "WeakKeyDictionary[up.model.ROState, Dict[FNode, FNode]]" = (
+            WeakKeyDictionary()
+        )
+        # Grounded FluentExp per (effect, evaluated arguments); the resulting
+        # expression is fully determined by the key, so it is safe to reuse
+        # across states and skips an ExpressionManager round-trip.
+        self._fluent_exp_cache: Dict[Tuple[int, Tuple[FNode, ...]], FNode] = {}
+        # Scratch containers reused by _apply_unsafe and
+        # _get_unsatisfied_conditions instead of allocating fresh ones per
+        # call; both methods clear them on entry and copy out any value that
+        # outlives the call, and neither method is re-entered while running.
+        self._scratch_updated_values: Dict[FNode, FNode] = {}
+        self._scratch_assigned_fluent: Set[FNode] = set()
+        # Per-state memoization of the simulated-effect function results, so
+        # that validating the bounds and applying the same event do not invoke
+        # the (potentially expensive) user callback twice.
+        self._sim_effect_cache: "WeakKeyDictionary[up.model.ROState, Dict[int, List[FNode]]]" = (
+            WeakKeyDictionary()
+        )
+        # Per-state memoization of the unsatisfied goals: the goals are
+        # problem-global, so revisiting a state answers is_goal from here.
+        self._goal_cache: "WeakKeyDictionary[up.model.ROState, List[FNode]]" = (
+            WeakKeyDictionary()
+        )
+
+    def _get_simulated_effect_values(
+        self, event: "Event", state: "up.model.ROState"
+    ) -> List[FNode]:
+        """
+        Returns the values computed by the simulated effect of the given event
+        in the given state, caching them per state.
+
+        :param event: The event whose simulated effect must be computed; it
+            must have one.
+        :param state: The `State` passed to the simulated effect function.
+        :return: The values returned by the simulated effect function.
+        """
+        assert event.simulated_effect is not None
+        cache = self._sim_effect_cache.get(state)
+        if cache is None:
+            cache = {}
+            self._sim_effect_cache[state] = cache
+        key = id(event.simulated_effect)
+        values = cache.get(key)
+        if values is None:
+            values = event.simulated_effect.function(self._problem, state, {})
+            cache[key] = values
+        return values
+
+    def _evaluate(self, expression: FNode, state: "up.model.ROState") -> FNode:
+        """
+        Evaluates the given expression in the given state, caching the result
+        so that repeated evaluations of the same expression in the same state
+        are single dict lookups.
+
+        :param expression: The expression to evaluate.
+        :param state: The `State` in which the expression is evaluated.
+        :return: The evaluated expression.
+        """
+        cache = self._eval_cache.get(state)
+        if cache is None:
+            cache = {}
+            self._eval_cache[state] = cache
+        result = cache.get(expression)
+        if result is None:
+            result = self._se.evaluate(expression, state)
+            cache[expression] = result
+        return result
 
     def _get_unsatisfied_conditions(
         self, event: "Event", state: "up.model.ROState", early_termination: bool = False
@@ -98,7 +332,7 @@ class SequentialSimulator(Engine, SimulatorMixin):
         """
         unsatisfied_conditions = []
         for c in event.conditions:
-            evaluated_cond = self._se.evaluate(c, state)
+            evaluated_cond = self._evaluate(c, state)
             if (
                 not evaluated_cond.is_bool_constant()
                 or not evaluated_cond.bool_constant_value()
@@ -107,74 +341,110 @@ class SequentialSimulator(Engine, SimulatorMixin):
                 if early_termination:
                     break
 
-        # check that the assignments will respect the bound typing
-        new_bounded_types_values: Dict["up.model.FNode", "up.model.FNode"] = {}
-        assigned_fluent: Set["up.model.FNode"] = set()
-        em = self._problem.environment.expression_manager
-        for effect in event.effects:
-            lower_bound, upper_bound = None, None
-            f_type = cast(_RealType, effect.fluent.type)
-            if f_type.is_int_type() or f_type.is_real_type():
-                lower_bound, upper_bound = f_type.lower_bound, f_type.upper_bound
-            if lower_bound is not None or upper_bound is not None:
-                fluent, value = self._evaluate_effect(
-                    effect, state, new_bounded_types_values, assigned_fluent, em
+        # check that the assignments will respect the bound typing; which
+        # effects need the check is static metadata precomputed per event
+        bounded_effects = getattr(event, "_bounded_effects", None)
+        if bounded_effects is None:
+            bounded_effects = _compute_bounded_effects(event.effects)
+        new_bounded_types_values = self._scratch_updated_values
+        new_bounded_types_values.clear()
+        assigned_fluent = self._scratch_assigned_fluent
+        assigned_fluent.clear()
+        em = self._em
+        for effect, lower_bound, upper_bound in bounded_effects:
+            fluent, value = self._evaluate_effect(
+                effect, state, new_bounded_types_values, assigned_fluent, em
+            )
+            if fluent is not None:
+                assert value is not None
+                new_bounded_types_values[fluent] = value
+                if lower_bound is not None and lower_bound > cast(
+                    Fraction, value.constant_value()
+                ):
+                    unsatisfied_conditions.append(em.LE(lower_bound, fluent))
+                    if early_termination:
+                        break
+                if upper_bound is not None and upper_bound < cast(
+                    Fraction, value.constant_value()
+                ):
+                    unsatisfied_conditions.append(em.LE(fluent, upper_bound))
+                    if early_termination:
+                        break
+        if event.simulated_effect is not None:
+            sim_effect_bounds = getattr(event, "_sim_effect_bounds", None)
+            if sim_effect_bounds is None:
+                sim_effect_bounds = _compute_simulated_effect_bounds(
+                    event.simulated_effect
                 )
-                if fluent is not None:
-                    assert value is not None
-                    new_bounded_types_values[fluent] = value
-                    if lower_bound is not None and lower_bound > cast(
-                        Fraction, value.constant_value()
+            if sim_effect_bounds:
+                values = self._get_simulated_effect_values(event, state)
+                for (
+                    idx,
+                    lower_bound,
+                    upper_bound,
+                    lower_literal,
+                    upper_literal,
+                ) in sim_effect_bounds:
+                    v = values[idx]
+                    if (
+                        lower_bound is not None
+                        and cast(Fraction, v.constant_value()) < lower_bound
                     ):
-                        unsatisfied_conditions.append(em.LE(lower_bound, fluent))
+                        unsatisfied_conditions.append(lower_literal)
                         if early_termination:
                             break
-                    if upper_bound is not None and upper_bound < cast(
-                        Fraction, value.constant_value()
+                    if (
+                        upper_bound is not None
+                        and cast(Fraction, v.constant_value()) > upper_bound
                     ):
-                        unsatisfied_conditions.append(em.LE(fluent, upper_bound))
+                        unsatisfied_conditions.append(upper_literal)
                         if early_termination:
                             break
-        if event.simulated_effect is not None:
-            to_check = False
-            for f in event.simulated_effect.fluents:
-                f_type = cast(_RealType, f.type)
-                if (f_type.is_int_type() or f_type.is_real_type()) and (
-                    f_type.lower_bound is not None or f_type.upper_bound is not None
-                ):
-                    to_check = True
-                    break
-            if to_check:
-                for f, v in zip(
-                    event.simulated_effect.fluents,
-                    event.simulated_effect.function(self._problem, state, {}),
-                ):
-                    lower_bound, upper_bound = None, None
-                    f_type = cast(_RealType, f.type)
-                    if f_type.is_int_type() or f_type.is_real_type():
-                        lower_bound, upper_bound = (
-                            f_type.lower_bound,
-                            f_type.upper_bound,
-                        )
-                    if lower_bound is not None or upper_bound is not None:
-                        if (
-                            lower_bound is not None
-                            and cast(Fraction, v.constant_value()) < lower_bound
-                        ):
-                            unsatisfied_conditions.append(em.LE(lower_bound, f))
-                            if early_termination:
-                                break
-                        if (
-                            upper_bound is not None
-                            and cast(Fraction, v.constant_value()) > upper_bound
-                        ):
-                            unsatisfied_conditions.append(em.LE(f, upper_bound))
-                            if early_termination:
-                                break
         return unsatisfied_conditions
 
+    def _is_applicable_fast(self, event: "Event", state: "up.model.ROState") -> bool:
+        """
+        Fast-path applicability test used when filtering events: only whether
+        some condition fails matters, so the condition loop short-circuits on
+        the first failure and the effect bound validation runs only for events
+        that actually have bounded effects.
+
+        :param event: The event whose applicability must be checked.
+        :param state: The `State` in which the check is performed.
+        :return: True if the event is applicable in the state, False otherwise.
+        """
+        compiled_check = None
+        if isinstance(event, InstantaneousEvent):
+            if not event._check_compiled:
+                event._compile_check()
+            compiled_check = event._compiled_check
+        if compiled_check is not None:
+            if not compiled_check(state):
+                return False
+        else:
+            for c in event.conditions:
+                evaluated_cond = self._evaluate(c, state)
+                if (
+                    not evaluated_cond.is_bool_constant()
+                    or not evaluated_cond.bool_constant_value()
+                ):
+                    return False
+        if getattr(event, "_bounded_effects", True) or (
+            event.simulated_effect is not None
+            and getattr(event, "_sim_effect_bounds", True)
+        ):
+            # the bound validation is still needed; the conditions above are
+            # re-checked there but hit the per-state evaluation cache
+            return (
+                len(self._get_unsatisfied_conditions(event, state, True)) == 0
+            )
+        return True
+
     def _apply(
-        self, event: "Event", state: "up.model.COWState"
+        self,
+        event: "Event",
+        state: "up.model.COWState",
+        assume_applicable: bool = False,
     ) -> Optional["up.model.COWState"]:
         """
         Returns `None` if the event is not applicable in the given state, otherwise returns a new COWState,
@@ -183,10 +453,12 @@ class SequentialSimulator(Engine, SimulatorMixin):
 
         :param state: the state where the event formulas are calculated.
         :param event: the event that has the information about the conditions to check and the effects to apply.
+        :param assume_applicable: if True the applicability check is skipped; the caller states that
+            `self.is_applicable(event, state)` holds, with the same correctness contract as `apply_unsafe`.
         :return: None if the event is not applicable in the given state, a new COWState with some updated values
             if the event is applicable.
         """
-        if not self.is_applicable(event, state):
+        if not assume_applicable and not self.is_applicable(event, state):
             return None
         else:
             return self.apply_unsafe(event, state)
@@ -203,12 +475,26 @@ class SequentialSimulator(Engine, SimulatorMixin):
         :param event: the event that has the information about the effects to apply.
         :return: A new COWState with some updated values.
         """
-        updated_values: Dict["up.model.FNode", "up.model.FNode"] = {}
-        assigned_fluent: Set["up.model.FNode"] = set()
-        em = self._problem.environment.expression_manager
-        for effect in event.effects:
+        if getattr(event, "_is_simple", False):
+            # unconditional assignments to distinct ground fluents: no
+            # conflict detection or simulated effect handling is needed
+            return state.make_child(
+                {
+                    effect.fluent: self._evaluate(effect.value, state)
+                    for effect in event.effects
+                }
+            )
+        updated_values = self._scratch_updated_values
+        updated_values.clear()
+        assigned_fluent = self._scratch_assigned_fluent
+        assigned_fluent.clear()
+        em = self._em
+        effects_data = getattr(event, "_effects_data", None)
+        if effects_data is None:
+            effects_data = _compute_effects_data(event.effects)
+        for effect, tag, condition in effects_data:
             fluent, value = self._evaluate_effect(
-                effect, state, updated_values, assigned_fluent, em
+                effect, state, updated_values, assigned_fluent, em, tag, condition
             )
             if fluent is not None:
                 assert value is not None
@@ -216,7 +502,7 @@ class SequentialSimulator(Engine, SimulatorMixin):
         if event.simulated_effect is not None:
             for f, v in zip(
                 event.simulated_effect.fluents,
-                event.simulated_effect.function(self._problem, state, {}),
+                self._get_simulated_effect_values(event, state),
             ):
                 old_value = updated_values.get(f, None)
                 # If f was already modified and it was modified by an increase/decrease or with an assign
@@ -234,7 +520,9 @@ class SequentialSimulator(Engine, SimulatorMixin):
                         updated_values[f] = v
                 else:
                     updated_values[f] = v
-        return state.make_child(updated_values)
+        # the new state takes ownership of the dict, so hand it a copy and
+        # keep the scratch one for the next call
+        return state.make_child(dict(updated_values))
 
     def _evaluate_effect(
         self,
@@ -243,6 +531,8 @@ class SequentialSimulator(Engine, SimulatorMixin):
         updated_values: Dict["up.model.FNode", "up.model.FNode"],
         assigned_fluent: Set["up.model.FNode"],
         em: ExpressionManager,
+        tag: Optional[int] = None,
+        condition: Optional[FNode] = None,
     ) -> Tuple[Optional[FNode], Optional[FNode]]:
         """
         Evaluates the given effect in the state, and returns the fluent affected
@@ -258,20 +548,36 @@ class SequentialSimulator(Engine, SimulatorMixin):
         :param assigned_fluent: The set containing all the fluents already assigned in the
             event containing this effect.
         :param em: The current environment expression manager.
+        :param tag: The precomputed kind tag of the effect; when None, the
+            kind and the condition are derived from the effect itself.
+        :param condition: The precomputed effect condition (None when the
+            effect is unconditional); only meaningful when tag is given.
         :return: The Tuple[Fluent, Value], where the fluent is the one affected by the given
             effect and value is the new value assigned to the fluent.
         :raises UPConflictingEffectsException: If to the same fluent are assigned 2 different
             values.
         """
-        evaluated_args = tuple(self._se.evaluate(a, state) for a in effect.fluent.args)
-        fluent = self._problem.environment.expression_manager.FluentExp(
-            effect.fluent.fluent(), evaluated_args
-        )
-        if (not effect.is_conditional()) or self._se.evaluate(
-            effect.condition, state
-        ).is_true():
-            new_value = self._se.evaluate(effect.value, state)
+        if tag is None:
             if effect.is_assignment():
+                tag = _EFFECT_ASSIGN
+            elif effect.is_increase():
+                tag = _EFFECT_INCREASE
+            elif effect.is_decrease():
+                tag = _EFFECT_DECREASE
+            else:
+                raise NotImplementedError
+            condition = effect.condition if effect.is_conditional() else None
+        evaluated_args = tuple(self._evaluate(a, state) for a in effect.fluent.args)
+        key = (id(effect), evaluated_args)
+        fluent = self._fluent_exp_cache.get(key)
+        if fluent is None:
+            fluent = self._em.FluentExp(
+                effect.fluent.fluent(), evaluated_args
+            )
+            self._fluent_exp_cache[key] = fluent
+        if condition is None or self._evaluate(condition, state).is_true():
+            new_value = self._evaluate(effect.value, state)
+            if tag == _EFFECT_ASSIGN:
                 old_value = updated_values.get(fluent, None)
                 if (
                     old_value is not None
@@ -300,23 +606,22 @@ class SequentialSimulator(Engine, SimulatorMixin):
                     )
                 # If the fluent is in updated_values, we take his modified value, (which was modified by another increase or decrease)
                 # otherwise we take it's evaluation in the state as it's value.
-                f_eval = updated_values.get(fluent, self._se.evaluate(fluent, state))
-                if effect.is_increase():
-                    return (
-                        fluent,
-                        em.auto_promote(
-                            f_eval.constant_value() + new_value.constant_value()
-                        )[0],
-                    )
-                elif effect.is_decrease():
-                    return (
-                        fluent,
-                        em.auto_promote(
-                            f_eval.constant_value() - new_value.constant_value()
-                        )[0],
-                    )
+                # dict.get with a call as default would evaluate the fluent
+                # even on a hit, so only fall back to the evaluator on a miss
+                f_eval = updated_values.get(fluent)
+                if f_eval is None:
+                    f_eval = self._evaluate(fluent, state)
+                if tag == _EFFECT_INCREASE:
+                    new_constant = f_eval.constant_value() + new_value.constant_value()
                 else:
-                    raise NotImplementedError
+                    new_constant = f_eval.constant_value() - new_value.constant_value()
+                # the sum/difference of two numeric constants is always an
+                # int or a Fraction, so the typed constructors can be called
+                # directly, skipping the auto_promote dispatch and the list
+                # it allocates
+                if isinstance(new_constant, int):
+                    return fluent, em.Int(new_constant)
+                return fluent, em.Real(new_constant)
         else:
             return None, None
 
@@ -329,13 +634,13 @@ class SequentialSimulator(Engine, SimulatorMixin):
         :param state: The state where the formulas are evaluated.
         :return: an Iterator of applicable Events.
         """
-        # if the problem was never fully grounded before,
-        # ground it and save all the new events. For every event
-        # that is applicable, yield it.
+        # if the problem was never fully grounded before, ground it lazily
+        # while the returned iterator is consumed, creating and caching the
+        # events on demand. The grounding is recorded as complete only once a
+        # full pass has actually been consumed, so an early-terminated
+        # iteration does not leave the event cache silently incomplete.
         # Otherwise just return all the applicable events
         if not self._all_events_grounded:
-            # perform total grounding
-            self._all_events_grounded = True
             # for every grounded action, translate it in an Event
             for (
                 original_action,
@@ -345,12 +650,13 @@ class SequentialSimulator(Engine, SimulatorMixin):
                 for event in self._get_or_create_events(
                     original_action, params, grounded_action
                 ):
-                    if self.is_applicable(event, state):
+                    if self._is_applicable_fast(event, state):
                         yield event
+            self._all_events_grounded = True
         else:  # the problem has been fully grounded before, just check for event applicability
             for events in self._events.values():
                 for event in events:
-                    if self.is_applicable(event, state):
+                    if self._is_applicable_fast(event, state):
                         yield event
 
     def _get_events(
@@ -368,13 +674,20 @@ class SequentialSimulator(Engine, SimulatorMixin):
         :return: the List of Events derived from this action with these parameters.
         """
         # sanity check
-        if action not in self._actions:
+        if id(action) not in self._action_ids:
             raise UPUsageError(
                 "The action given as parameter does not belong to the problem given to the SequentialSimulator."
             )
         params_exp = tuple(
-            self._problem.environment.expression_manager.auto_promote(parameters)
+            self._em.auto_promote(parameters)
         )
+        # the events for this exact grounding are usually already cached;
+        # in that case the grounder does not need to be consulted at all
+        event_list = self._events_by_ids.get(
+            (id(action), tuple(id(p) for p in params_exp))
+        )
+        if event_list is not None:
+            return event_list
         grounded_action = self._grounder.ground_action(action, params_exp)
         event_list = self._get_or_create_events(action, params_exp, grounded_action)
         return event_list
@@ -390,13 +703,20 @@ class SequentialSimulator(Engine, SimulatorMixin):
         :param early_termination: Flag deciding if the method ends and returns at the first unsatisfied goal.
         :return: The list of all the goals that evaluated to False or the list containing the first goal evaluated to False if the flag "early_termination" is set.
         """
+        cached = self._goal_cache.get(state)
+        if cached is not None:
+            return cached[:1] if early_termination else list(cached)
         unsatisfied_goals = []
         for g in cast(up.model.Problem, self._problem).goals:
-            g_eval = self._se.evaluate(g, state).bool_constant_value()
+            g_eval = self._evaluate(g, state).bool_constant_value()
             if not g_eval:
                 unsatisfied_goals.append(g)
                 if early_termination:
                     break
+        if not early_termination:
+            # a truncated scan would poison the cache, so only complete
+            # results are stored
+            self._goal_cache[state] = list(unsatisfied_goals)
         return unsatisfied_goals
 
     @property
@@ -455,6 +775,10 @@ class SequentialSimulator(Engine, SimulatorMixin):
         """
         if isinstance(original_action, up.model.InstantaneousAction):
             # check if the event is already cached; if not: create it and cache it
+            id_key = (id(original_action), tuple(id(p) for p in params))
+            event_list = self._events_by_ids.get(id_key, None)
+            if event_list is not None:
+                return event_list
             key = (original_action, params)
             event_list = self._events.get(key, None)
             if event_list is None:
@@ -472,6 +796,7 @@ class SequentialSimulator(Engine, SimulatorMixin):
                         )
                     ]
                 self._events[key] = event_list
+            self._events_by_ids[id_key] = event_list
             # sanity check
             assert len(event_list) < 2
             return event_list
@@ -21,7 +21,7 @@ such as the :func:`ExpressionManager <unified_planning.Environment.expression_ma
 
 
 import sys
-from typing import IO, Optional
+from typing import IO, Dict, Optional, Tuple
 import unified_planning
 
 
@@ -51,6 +51,12 @@ class Environment:
         self._names_extractor = unified_planning.model.walkers.NamesExtractor()
         self._credits_stream: Optional[IO[str]] = sys.stdout
         self._error_used_name: bool = True
+        # flyweight cache of Parameter instances keyed by (name, type);
+        # Parameter is immutable, so identical triples can share one object
+        self._parameter_cache: Dict[
+            Tuple[str, "unified_planning.model.types.Type"],
+            "unified_planning.model.Parameter",
+        ] = {}
 
     # The getstate and setstate method are needed in the Parallel engine. The
     #  Parallel engine creates a deep copy of the Environment instance in
@@ -85,6 +91,19 @@ class Environment:
         """
         self._error_used_name = new_val
 
+    def _build_parameter(
+        self, name: str, typename: "unified_planning.model.types.Type"
+    ) -> "unified_planning.model.Parameter":
+        """Returns the `Parameter` with the given `name` and `type`, creating
+        it on the first request and returning the shared instance afterwards;
+        avoids re-allocating identical parameters for every cloned action."""
+        key = (name, typename)
+        param = self._parameter_cache.get(key)
+        if param is None:
+            param = unified_planning.model.Parameter(name, typename, self)
+            self._parameter_cache[key] = param
+        return param
+
     @property
     def free_vars_oracle(self) -> "unified_planning.model.FreeVarsOracle":
         """Returns the environment's `FreeVarsOracle`."""
@@ -15,19 +15,32 @@
 
 
 from fractions import Fraction
+from functools import lru_cache
 import re
 import sys
 import unified_planning as up
 import unified_planning.model.htn
 import unified_planning.model.walkers as walkers
 from unified_planning.model.types import _UserType, _IntType, _RealType
-from typing import Dict, IO, Optional, cast
+from typing import Dict, IO, List, Optional, cast
 from io import StringIO
 
 
 class ConverterToPythonString(walkers.DagWalker):
     """Expression converter to a Python string."""
 
+    # Pre-bound format methods for the fixed-arity walkers: binding
+    # "template".format once at class scope replaces the per-call f-string
+    # formatting opcodes with a single call.
+    _FMT_NOT = "emgr.Not({})".format
+    _FMT_IMPLIES = "emgr.Implies({}, {})".format
+    _FMT_IFF = "emgr.Iff({}, {})".format
+    _FMT_MINUS = "emgr.Minus({}, {})".format
+    _FMT_DIV = "emgr.Div({}, {})".format
+    _FMT_LE = "emgr.LE({}, {})".format
+    _FMT_LT = "emgr.LT({}, {})".format
+    _FMT_EQUALS = "emgr.Equals({}, {})".format
+
     def __init__(
         self, environment: "up.environment.Environment", names_mapping: Dict[str, str]
     ):
@@ -38,6 +51,21 @@ class ConverterToPythonString(walkers.DagWalker):
         """Converts the given expression to a python command."""
         if expression is None:
             return "None"
+        # Fast path for the leaf shapes dominating the call sites (default
+        # TRUE() effect conditions, object and parameter references): emit
+        # them directly instead of going through the DAG walker machinery.
+        if expression.is_bool_constant():
+            return (
+                "emgr.TRUE()" if expression.bool_constant_value() else "emgr.FALSE()"
+            )
+        if expression.is_object_exp():
+            return self.walk_object_exp(expression, [])
+        if expression.is_parameter_exp():
+            return self.walk_param_exp(expression, [])
+        if expression.is_int_constant():
+            return self.walk_int_constant(expression, [])
+        if expression.is_real_constant():
+            return self.walk_real_constant(expression, [])
         return self.walk(expression)
 
     def walk_exists(self, expression, args):
@@ -63,23 +91,23 @@ class ConverterToPythonString(walkers.DagWalker):
 
     def walk_and(self, expression, args):
         assert len(args) > 1
-        return f'emgr.And({", ".join(args)})'
+        return "emgr.And(" + ", ".join(args) + ")"
 
     def walk_or(self, expression, args):
         assert len(args) > 1
-        return f'emgr.Or({", ".join(args)})'
+        return "emgr.Or(" + ", ".join(args) + ")"
 
     def walk_not(self, expression, args):
         assert len(args) == 1
-        return f"emgr.Not({args[0]})"
+        return self._FMT_NOT(args[0])
 
     def walk_implies(self, expression, args):
         assert len(args) == 2
-        return f"emgr.Implies({args[0]}, {args[1]})"
+        return self._FMT_IMPLIES(args[0], args[1])
 
     def walk_iff(self, expression, args):
         assert len(args) == 2
-        return f"emgr.Iff({args[0]}, {args[1]})"
+        return self._FMT_IFF(args[0], args[1])
 
     def walk_fluent_exp(self, expression, args):
         fluent = expression.fluent()
@@ -118,31 +146,31 @@ class ConverterToPythonString(walkers.DagWalker):
 
     def walk_plus(self, expression, args):
         assert len(args) > 1
-        return f'emgr.Plus({", ".join(args)})'
+        return "emgr.Plus(" + ", ".join(args) + ")"
 
     def walk_minus(self, expression, args):
         assert len(args) == 2
-        return f"emgr.Minus({args[0]}, {args[1]})"
+        return self._FMT_MINUS(args[0], args[1])
 
     def walk_times(self, expression, args):
         assert len(args) > 1
-        return f'emgr.Times({", ".join(args)})'
+        return "emgr.Times(" + ", ".join(args) + ")"
 
     def walk_div(self, expression, args):
         assert len(args) == 2
-        return f"emgr.Div({args[0]}, {args[1]})"
+        return self._FMT_DIV(args[0], args[1])
 
     def walk_le(self, expression, args):
         assert len(args) == 2
-        return f"emgr.LE({args[0]}, {args[1]})"
+        return self._FMT_LE(args[0], args[1])
 
     def walk_lt(self, expression, args):
         assert len(args) == 2
-        return f"emgr.LT({args[0]}, {args[1]})"
+        return self._FMT_LT(args[0], args[1])
 
     def walk_equals(self, expression, args):
         assert len(args) == 2
-        return f"emgr.Equals({args[0]}, {args[1]})"
+        return self._FMT_EQUALS(args[0], args[1])
 
 
 class PythonWriter:
@@ -156,7 +184,11 @@ class PythonWriter:
 
     def _write_problem_code(self, out: IO[str]):
 
-        names_mapping: Dict[str, str] = {}
+        # The output is accumulated into a list of fragments and flushed with a
+        # single write at the end: the caller's stream may be unbuffered (a
+        # file or sys.stdout) and large problems emit thousands of fragments.
+        parts: List[str] = []
+        names_mapping: Dict[str, str] = _NamesMapping()
 
         def params_as_dict(parameters) -> str:
             """Transforms a list of Parameter into an OrderedDict"""
@@ -186,22 +218,23 @@ class PythonWriter:
                 names_mapping[action_var_name] = action_var_name
 
         converter = ConverterToPythonString(self.problem.environment, names_mapping)
-        out.write("from fractions import Fraction\n")
-        out.write("from collections import OrderedDict\n")
-        out.write("import unified_planning as up\n")
-        out.write("environment = up.environment.get_environment()\n")
-        out.write("emgr = environment.expression_manager\n")
-        out.write("tm = environment.type_manager\n")
+        parts.append("from fractions import Fraction\n")
+        parts.append("from collections import OrderedDict\n")
+        parts.append("import unified_planning as up\n")
+        parts.append("environment = up.environment.get_environment()\n")
+        parts.append("emgr = environment.expression_manager\n")
+        parts.append("tm = environment.type_manager\n")
 
         for type in self.problem.user_types:  # define user_types
             utype = cast(_UserType, type)
-            if utype.father is None:
-                out.write(
-                    f'{_get_mangled_name(f"type_{utype.name}", names_mapping)} = tm.UserType("{utype.name}")\n'
-                )
+            name = utype.name
+            father = utype.father
+            mangled = _get_mangled_name(f"type_{name}", names_mapping)
+            if father is None:
+                parts.append(f'{mangled} = tm.UserType("{name}")\n')
             else:
-                out.write(
-                    f'{_get_mangled_name(f"type_{utype.name}", names_mapping)} = tm.UserType("{utype.name}", {_get_mangled_name(f"type_{cast(_UserType, utype.father).name}", names_mapping)})\n'
+                parts.append(
+                    f'{mangled} = tm.UserType("{name}", {_get_mangled_name(f"type_{cast(_UserType, father).name}", names_mapping)})\n'
                 )
 
         for f in self.problem.fluents:  # define fluents
@@ -210,18 +243,25 @@ class PythonWriter:
                 for p in f.signature
             )
             params = f"OrderedDict([{params}])"
-            out.write(
+            parts.append(
                 f'{_get_mangled_name(f"fluent_{f.name}", names_mapping)} = up.model.Fluent("{f.name}", {_print_python_type(f.type, names_mapping)}, _signature={params})\n'
             )
 
+        # Objects are both defined and added to the problem; the add lines
+        # must appear after the problem creation, so they are staged here in
+        # one pass that reuses the mangled name instead of iterating (and
+        # mangling) all_objects a second time.
+        add_object_parts: List[str] = []
         for o in self.problem.all_objects:  # define objects
-            out.write(
-                f'{_get_mangled_name(f"object_{o.name}", names_mapping)} = up.model.Object("{o.name}", {_get_mangled_name(f"type_{cast(_UserType, o.type).name}", names_mapping)})\n'
+            o_var = _get_mangled_name(f"object_{o.name}", names_mapping)
+            parts.append(
+                f'{o_var} = up.model.Object("{o.name}", {_get_mangled_name(f"type_{cast(_UserType, o.type).name}", names_mapping)})\n'
             )
+            add_object_parts.append(f"problem.add_object({o_var})\n")
 
-        out.write("problem_initial_defaults = {}\n")  # define initial_defaults
+        parts.append("problem_initial_defaults = {}\n")  # define initial_defaults
         for type, exp in self.problem.initial_defaults.items():
-            out.write(
+            parts.append(
                 f"problem_initial_defaults[{_print_python_type(type, names_mapping)}] = {converter.convert(exp)}\n"
             )
 
@@ -232,90 +272,75 @@ class PythonWriter:
         problem_name = (
             f'"{self.problem.name}"' if self.problem.name is not None else "None"
         )
-        out.write(
+        parts.append(
             f"problem = up.model.{problem_class}({problem_name}, environment, initial_defaults=problem_initial_defaults)\n"
         )
 
-        for o in self.problem.all_objects:  # add objects to the problem
-            out.write(
-                f'problem.add_object({_get_mangled_name(f"object_{o.name}", names_mapping)})\n'
-            )
+        parts.extend(add_object_parts)  # add objects to the problem
 
+        fluents_defaults = self.problem.fluents_defaults
         for (
             f
         ) in (
             self.problem.fluents
         ):  # add fluents to the problem, with their fluents_default, if they have one
-            default = self.problem.fluents_defaults.get(f, None)
-            out.write(
-                f'problem.add_fluent({_get_mangled_name(f"fluent_{f.name}", names_mapping)}'
-            )
+            default = fluents_defaults.get(f, None)
+            fluent_var = _get_mangled_name(f"fluent_{f.name}", names_mapping)
             if default is not None:  # the fluent has a default value
-                out.write(f", default_initial_value={converter.convert(default)}")
-            out.write(")\n")
+                parts.append(
+                    f"problem.add_fluent({fluent_var}, default_initial_value={converter.convert(default)})\n"
+                )
+            else:
+                parts.append(f"problem.add_fluent({fluent_var})\n")
 
         for a in self.problem.actions:  # define actions and add them to the problem
+            act_var = _get_mangled_name(f"act_{a.name}", names_mapping)
             if isinstance(a, up.model.InstantaneousAction):
                 params = params_as_dict(a.parameters)
-                out.write(
-                    f'{_get_mangled_name(f"act_{a.name}", names_mapping)} = up.model.InstantaneousAction("{a.name}", _parameters={params})\n'
+                parts.append(
+                    f'{act_var} = up.model.InstantaneousAction("{a.name}", _parameters={params})\n'
                 )
                 for p in a.preconditions:
-                    out.write(
-                        f'{_get_mangled_name(f"act_{a.name}", names_mapping)}.add_precondition({converter.convert(p)})\n'
+                    parts.append(
+                        f'{act_var}.add_precondition({converter.convert(p)})\n'
                     )
                 for e in a.effects:
-                    if e.is_increase():
-                        out.write(
-                            f'{_get_mangled_name(f"act_{a.name}", names_mapping)}.add_increase_effect(fluent={converter.convert(e.fluent)}, value={converter.convert(e.value)}, condition={converter.convert(e.condition)})\n'
-                        )
-                    elif e.is_decrease():
-                        out.write(
-                            f'{_get_mangled_name(f"act_{a.name}", names_mapping)}.add_decrease_effect(fluent={converter.convert(e.fluent)}, value={converter.convert(e.value)}, condition={converter.convert(e.condition)})\n'
-                        )
-                    else:
-                        out.write(
-                            f'{_get_mangled_name(f"act_{a.name}", names_mapping)}.add_effect(fluent={converter.convert(e.fluent)}, value={converter.convert(e.value)}, condition={converter.convert(e.condition)})\n'
-                        )
+                    method = _ACTION_EFFECT_METHODS[e.kind]
+                    parts.append(
+                        f'{act_var}.{method}(fluent={converter.convert(e.fluent)}, value={converter.convert(e.value)}, condition={converter.convert(e.condition)})\n'
+                    )
             elif isinstance(a, up.model.DurativeAction):
-                out.write(
-                    f'{_get_mangled_name(f"act_{a.name}", names_mapping)} = up.model.DurativeAction("{a.name}"'
+                parts.append(
+                    f'{act_var} = up.model.DurativeAction("{a.name}"'
                 )
                 for ap in a.parameters:
-                    out.write(
+                    parts.append(
                         f", {ap.name}={_print_python_type(ap.type, names_mapping)}"
                     )
-                out.write(")\n")
+                parts.append(")\n")
                 for ap in a.parameters:
-                    out.write(
-                        f'parameter_{ap.name} = {_get_mangled_name(f"act_{a.name}", names_mapping)}.parameter("{ap.name}")\n'
+                    parts.append(
+                        f'parameter_{ap.name} = {act_var}.parameter("{ap.name}")\n'
                     )
-                out.write(
-                    f'{_get_mangled_name(f"act_{a.name}", names_mapping)}.set_duration_constraint({_convert_interval_duration(a.duration, converter)})\n'
+                parts.append(
+                    f'{act_var}.set_duration_constraint({_convert_interval_duration(a.duration, converter)})\n'
                 )
                 for i, cl in a.conditions.items():
                     for c in cl:
-                        out.write(
-                            f'{_get_mangled_name(f"act_{a.name}", names_mapping)}.add_condition({_convert_interval(i)}, {converter.convert(c)})\n'
+                        parts.append(
+                            f'{act_var}.add_condition({_convert_interval(i)}, {converter.convert(c)})\n'
                         )
                 for t, el in a.effects.items():
+                    timing_str = _convert_timing(t)
                     for e in el:
-                        if e.is_increase():
-                            out.write(
-                                f'{_get_mangled_name(f"act_{a.name}", names_mapping)}.add_increase_effect(timing={_convert_timing(t)}, fluent={converter.convert(e.fluent)}, value={converter.convert(e.value)}, condition={converter.convert(e.condition)})\n'
-                            )
-                        elif e.is_decrease():
-                            out.write(
-                                f'{_get_mangled_name(f"act_{a.name}", names_mapping)}.add_decrease_effect(timing={_convert_timing(t)}, fluent={converter.convert(e.fluent)}, value={converter.convert(e.value)}, condition={converter.convert(e.condition)})\n'
-                            )
-                        else:
-                            out.write(
-                                f'{_get_mangled_name(f"act_{a.name}", names_mapping)}.add_effect(timing={_convert_timing(t)}, fluent={converter.convert(e.fluent)}, value={converter.convert(e.value)}, condition={converter.convert(e.condition)})\n'
-                            )
+                        method = _ACTION_EFFECT_METHODS[e.kind]
+                        parts.append(
+                            f'{act_var}.{method}(timing={timing_str}, fluent={converter.convert(e.fluent)}, value={converter.convert(e.value)}, condition={converter.convert(e.condition)})\n'
+                        )
             else:
                 raise NotImplementedError
-            out.write(
-                f'problem.add_action({_get_mangled_name(f"act_{a.name}", names_mapping)})\n'
+            parts.append(
+                f'problem.add_action({act_var})\n'
             )
 
         for (
@@ -324,71 +349,50 @@ class PythonWriter:
         ) in (
             self.problem.explicit_initial_values.items()
         ):  # add only previously added initial values
-            out.write(
+            parts.append(
                 f"problem.set_initial_value({converter.convert(f_exp)}, {converter.convert(v_exp)})\n"
             )
 
         for t, el in self.problem.timed_effects.items():  # add timed effects
+            timing_str = _convert_timing(t)
             for e in el:
-                if e.is_increase():
-                    out.write(
-                        f"problem.add_increase_effect(timing={_convert_timing(t)}, fluent={converter.convert(e.fluent)}, value={converter.convert(e.value)}, condition={converter.convert(e.condition)})\n"
-                    )
-                elif e.is_decrease():
-                    out.write(
-                        f"problem.add_decrease_effect(timing={_convert_timing(t)}, fluent={converter.convert(e.fluent)}, value={converter.convert(e.value)}, condition={converter.convert(e.condition)})\n"
-                    )
-                else:
-                    out.write(
-                        f"problem.add_timed_effect(timing={_convert_timing(t)}, fluent={converter.convert(e.fluent)}, value={converter.convert(e.value)}, condition={converter.convert(e.condition)})\n"
-                    )
+                method = _TIMED_EFFECT_METHODS[e.kind]
+                parts.append(
+                    f"problem.{method}(timing={timing_str}, fluent={converter.convert(e.fluent)}, value={converter.convert(e.value)}, condition={converter.convert(e.condition)})\n"
+                )
 
         for i, gl in self.problem.timed_goals.items():  # add timed goals
             for g in gl:
-                out.write(
+                parts.append(
                     f"problem.add_timed_goal(interval={_convert_interval(i)}, goal={converter.convert(g)})\n"
                 )
 
         for g in self.problem.goals:  # add goals
-            out.write(f"problem.add_goal(goal={converter.convert(g)})\n")
+            parts.append(f"problem.add_goal(goal={converter.convert(g)})\n")
 
         for qm in self.problem.quality_metrics:  # adding metrics
             if isinstance(qm, up.model.metrics.MinimizeActionCosts):
-                out.write("costs = {}\n")
+                parts.append("costs = {}\n")
                 for a, ac in qm.costs.items():
-                    out.write(f"costs[act_{a.name}] = {converter.convert(ac)}\n")
+                    parts.append(f"costs[act_{a.name}] = {converter.convert(ac)}\n")
             elif isinstance(qm, up.model.metrics.Oversubscription):
-                out.write("goals = {}\n")
+                parts.append("goals = {}\n")
                 for goal, cost in qm.goals.items():
-                    out.write(f"goals[{converter.convert(goal)}] = {cost}\n")
+                    parts.append(f"goals[{converter.convert(goal)}] = {cost}\n")
             elif isinstance(qm, up.model.metrics.TemporalOversubscription):
-                out.write("goals = {}\n")
+                parts.append("goals = {}\n")
                 for (i, goal), cost in qm.goals.items():
-                    out.write(
+                    parts.append(
                         f"goals[({_convert_interval(i)}, {converter.convert(goal)})] = {cost}\n"
                     )
-            out.write("problem.add_quality_metric(")
-            if isinstance(qm, up.model.metrics.MinimizeActionCosts):
-                out.write(f"up.model.metrics.MinimizeActionCosts(costs, {qm.default})")
-            elif isinstance(qm, up.model.metrics.MinimizeSequentialPlanLength):
-                out.write("up.model.metrics.MinimizeSequentialPlanLength()")
-            elif isinstance(qm, up.model.metrics.MinimizeMakespan):
-                out.write("up.model.metrics.MinimizeMakespan()")
-            elif isinstance(qm, up.model.metrics.MinimizeExpressionOnFinalState):
-                out.write(
-                    f"up.model.metrics.MinimizeExpressionOnFinalState({converter.convert(qm.expression)})"
-                )
-            elif isinstance(qm, up.model.metrics.MaximizeExpressionOnFinalState):
-                out.write(
-                    f"up.model.metrics.MaximizeExpressionOnFinalState({converter.convert(qm.expression)})"
-                )
-            elif isinstance(qm, up.model.metrics.Oversubscription):
-                out.write("up.model.metrics.Oversubscription(goals)")
-            elif isinstance(qm, up.model.metrics.TemporalOversubscription):
-                out.write("up.model.metrics.TemporalOversubscription(goals)")
-            else:
+            # qm.__class__ rather than type(qm): `type` is shadowed by the
+            # initial_defaults loop variable in this method
+            emit_constructor = _METRIC_CONSTRUCTORS.get(qm.__class__)
+            if emit_constructor is None:
                 raise NotImplementedError
-            out.write(")\n")
+            parts.append("problem.add_quality_metric(")
+            parts.append(emit_constructor(qm, converter))
+            parts.append(")\n")
 
         if self.problem.kind.has_hierarchical():
             assert isinstance(
@@ -396,22 +400,24 @@ class PythonWriter:
             )
 
             for task in self.problem.tasks:
+                task_var = _get_mangled_name(f"task_{task.name}", names_mapping)
                 params = params_as_dict(task.parameters)
-                out.write(
-                    f'{_get_mangled_name(f"task_{task.name}", names_mapping)} = up.model.htn.Task("{task.name}", _parameters={params})\n'
+                parts.append(
+                    f'{task_var} = up.model.htn.Task("{task.name}", _parameters={params})\n'
                 )
-                out.write(
-                    f'problem.add_task({_get_mangled_name(f"task_{task.name}", names_mapping)})\n'
+                parts.append(
+                    f'problem.add_task({task_var})\n'
                 )
 
             for m in self.problem.methods:
+                method_var = _get_mangled_name(f"method_{m.name}", names_mapping)
                 params = params_as_dict(m.parameters)
-                out.write(
-                    f'{_get_mangled_name(f"method_{m.name}", names_mapping)} = up.model.htn.Method("{m.name}", _parameters={params})\n'
+                parts.append(
+                    f'{method_var} = up.model.htn.Method("{m.name}", _parameters={params})\n'
                 )
                 for mp in m.parameters:
-                    out.write(
-                        f'parameter_{mp.name} = {_get_mangled_name(f"method_{m.name}", names_mapping)}.parameter("{mp.name}")\n'
+                    parts.append(
+                        f'parameter_{mp.name} = {method_var}.parameter("{mp.name}")\n'
                     )
                 achieved_task_name = _get_mangled_name(
                     f"task_{m.achieved_task.task.name}", names_mapping
@@ -423,16 +429,16 @@ class PythonWriter:
                     ]
                 )
 
-                out.write(
-                    f'{_get_mangled_name(f"method_{m.name}", names_mapping)}.set_task({achieved_task_name}, {achieved_task_params})\n'
+                parts.append(
+                    f'{method_var}.set_task({achieved_task_name}, {achieved_task_params})\n'
                 )
                 for p in m.preconditions:
-                    out.write(
-                        f'{_get_mangled_name(f"method_{m.name}", names_mapping)}.add_precondition({converter.convert(p)})\n'
+                    parts.append(
+                        f'{method_var}.add_precondition({converter.convert(p)})\n'
                     )
                 for c in m.constraints:
-                    out.write(
-                        f'{_get_mangled_name(f"method_{m.name}", names_mapping)}.add_constraint({converter.convert(c)})\n'
+                    parts.append(
+                        f'{method_var}.add_constraint({converter.convert(c)})\n'
                     )
                 for st in m.subtasks:
                     if isinstance(st.task, up.model.htn.task.Task):
@@ -440,15 +446,15 @@ class PythonWriter:
                     else:
                         head = _get_mangled_name(f"act_{st.task.name}", names_mapping)
                     params = ", ".join([converter.convert(p) for p in st.parameters])
-                    out.write(
-                        f'{_get_mangled_name(f"method_{m.name}", names_mapping)}.add_subtask({head}, {params}, ident="{st.identifier}")\n'
+                    parts.append(
+                        f'{method_var}.add_subtask({head}, {params}, ident="{st.identifier}")\n'
                     )
-                out.write(
-                    f'problem.add_method({_get_mangled_name(f"method_{m.name}", names_mapping)})\n'
+                parts.append(
+                    f'problem.add_method({method_var})\n'
                 )
 
             for v in self.problem.task_network.variables:
-                out.write(
+                parts.append(
                     f'problem.task_network.add_variable("{v.name}", {_print_python_type(v.type, names_mapping)})\n'
                 )
             for st in self.problem.task_network.subtasks:
@@ -457,14 +463,16 @@ class PythonWriter:
                 else:
                     head = _get_mangled_name(f"act_{st.task.name}", names_mapping)
                 params = ", ".join([converter.convert(p) for p in st.parameters])
-                out.write(
+                parts.append(
                     f'problem.task_network.add_subtask({head}, {params}, ident="{st.identifier}")\n'
                 )
             for c in self.problem.task_network.constraints:
-                out.write(
+                parts.append(
                     f"problem.task_network.add_constraint({converter.convert(c)})\n"
                 )
 
+        out.write("".join(parts))
+
     def print_problem_python_commands(self):
         """Prints the string representing all the necessary commands to recreate the :class:`~unified_planning.model.Problem`."""
         self._write_problem_code(sys.stdout)
@@ -480,30 +488,93 @@ class PythonWriter:
 
         :param filename: The path to the file where the python code must be written.
         """
-        with open(filename, "w") as f:
+        # _write_problem_code issues a single write of the whole output, so
+        # the file sees one encode pass and one buffered write.
+        with open(filename, "w", encoding="utf-8") as f:
             self._write_problem_code(f)
 
 
+# Effect-kind dispatch tables: the emit loops index these by e.kind instead
+# of running an is_increase()/is_decrease() ladder per effect.
+_ACTION_EFFECT_METHODS = {
+    up.model.EffectKind.ASSIGN: "add_effect",
+    up.model.EffectKind.INCREASE: "add_increase_effect",
+    up.model.EffectKind.DECREASE: "add_decrease_effect",
+}
+_TIMED_EFFECT_METHODS = {
+    up.model.EffectKind.ASSIGN: "add_timed_effect",
+    up.model.EffectKind.INCREASE: "add_increase_effect",
+    up.model.EffectKind.DECREASE: "add_decrease_effect",
+}
+
+# Metric constructor emitters keyed by exact metric class (all the metric
+# classes are leaves of PlanQualityMetric, so type() lookup is safe).
+_METRIC_CONSTRUCTORS = {
+    up.model.metrics.MinimizeActionCosts: lambda qm, converter: f"up.model.metrics.MinimizeActionCosts(costs, {qm.default})",
+    up.model.metrics.MinimizeSequentialPlanLength: lambda qm, converter: "up.model.metrics.MinimizeSequentialPlanLength()",
+    up.model.metrics.MinimizeMakespan: lambda qm, converter: "up.model.metrics.MinimizeMakespan()",
+    up.model.metrics.MinimizeExpressionOnFinalState: lambda qm, converter: f"up.model.metrics.MinimizeExpressionOnFinalState({converter.convert(qm.expression)})",
+    up.model.metrics.MaximizeExpressionOnFinalState: lambda qm, converter: f"up.model.metrics.MaximizeExpressionOnFinalState({converter.convert(qm.expression)})",
+    up.model.metrics.Oversubscription: lambda qm, converter: "up.model.metrics.Oversubscription(goals)",
+    up.model.metrics.TemporalOversubscription: lambda qm, converter: "up.model.metrics.TemporalOversubscription(goals)",
+}
+
+
+# Patterns used by _get_mangled_name, compiled once at import time.
+_MANGLE_OK = re.compile("^[a-zA-Z_]+.*")
+_MANGLE_SUB = re.compile("[^0-9a-zA-Z_]")
+# Translation table mapping every ASCII character outside [0-9a-zA-Z_] to
+# "_"; str.translate runs the whole replacement in C, the regex is kept only
+# for non-ASCII names where the table would leave characters untouched.
+_MANGLE_TABLE = {
+    c: ord("_") for c in range(128) if not (chr(c).isalnum() or chr(c) == "_")
+}
+
+
+class _NamesMapping(Dict[str, str]):
+    """Mapping from original names to mangled names that also tracks the set
+    of mangled names already in use, so the freshness check performed by
+    `_get_mangled_name` is an O(1) set probe instead of a scan of values()."""
+
+    def __init__(self):
+        dict.__init__(self)
+        self.used_names: set = set()
+        # Cache of _print_python_type results keyed by id(type); types are
+        # interned by the type manager, so identity is a stable key and the
+        # cache lives exactly as long as this mapping (one problem write).
+        self.type_strs: Dict[int, str] = {}
+
+    def __setitem__(self, key: str, value: str):
+        dict.__setitem__(self, key, value)
+        self.used_names.add(value)
+
+
 def _get_mangled_name(original_name: str, names_mapping: Dict[str, str]) -> str:
     """Important note: This method updates the names_mapping"""
-    regex = re.compile("^[a-zA-Z_]+.*")
-    assert re.match(regex, original_name) is not None
     new_name: Optional[str] = names_mapping.get(original_name, None)
-    if new_name is None:  # The name is not in the map, so it must be added
-        if not original_name.isidentifier():  # Make the name a python identifier
-            new_name = re.sub("[^0-9a-zA-Z_]", "_", f"{original_name}")
+    if new_name is not None:  # Common case: the name is already mapped
+        return new_name
+    assert _MANGLE_OK.match(original_name) is not None
+    # The name is not in the map, so it must be added
+    if not original_name.isidentifier():  # Make the name a python identifier
+        if original_name.isascii():
+            new_name = original_name.translate(_MANGLE_TABLE)
         else:
-            new_name = original_name
-        test_name = new_name  # Init values
-        count = 0
-        while test_name in names_mapping.values():  # Loop until we find a fresh name
-            test_name = f"{new_name}_{str(count)}"
-            count += 1
-        new_name = test_name
-        names_mapping[
-            original_name
-        ] = new_name  # Once a fresh valid name is found, update the map.
-    assert new_name is not None
+            new_name = _MANGLE_SUB.sub("_", original_name)
+    else:
+        new_name = original_name
+    used_names = getattr(names_mapping, "used_names", None)
+    if used_names is None:  # Plain dict given: fall back to a one-shot set
+        used_names = set(names_mapping.values())
+    test_name = new_name  # Init values
+    count = 0
+    while test_name in used_names:  # Loop until we find a fresh name
+        test_name = f"{new_name}_{str(count)}"
+        count += 1
+    new_name = test_name
+    names_mapping[
+        original_name
+    ] = new_name  # Once a fresh valid name is found, update the map.
     assert new_name.isidentifier()
     return new_name
 
@@ -513,6 +584,20 @@ def _print_python_type(
 ) -> str:
     """This method takes a type and returns how to use it from command line.
     For the user_types it assumes they have already been created and just refers to them."""
+    cache = getattr(names_mapping, "type_strs", None)
+    if cache is not None:
+        cached = cache.get(id(type))
+        if cached is not None:
+            return cached
+    result = _print_python_type_uncached(type, names_mapping)
+    if cache is not None:
+        cache[id(type)] = result
+    return result
+
+
+def _print_python_type_uncached(
+    type: "up.model.types.Type", names_mapping: Dict[str, str]
+) -> str:
     if type.is_user_type():
         return (
             f'{_get_mangled_name(f"type_{cast(_UserType, type).name}", names_mapping)}'
@@ -529,6 +614,10 @@ def _print_python_type(
         raise NotImplementedError
 
 
+# Timings and intervals hash by value and their conversion does not depend
+# on the names mapping, so the results can be shared by every effect and
+# condition using the same timepoint, across problems too.
+@lru_cache(maxsize=None)
 def _convert_timing(timing: up.model.Timing) -> str:
     delay: str = f"{str(timing.delay)}"
     if isinstance(timing.delay, Fraction):
@@ -551,6 +640,7 @@ def _convert_timing(timing: up.model.Timing) -> str:
             return f"up.model.EndTiming(container={container}) + {delay}"
 
 
+@lru_cache(maxsize=None)
 def _convert_interval(interval: up.model.TimeInterval) -> str:
     interval_feature: str = "up.model.ClosedTimeInterval"
     if interval.is_left_open() and interval.is_right_open():
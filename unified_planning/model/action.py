@@ -21,7 +21,6 @@ and a `list` of `effects`.
 
 import unified_planning as up
 from unified_planning.environment import get_environment, Environment
-import unified_planning.shortcuts
 from unified_planning.exceptions import (
     UPTypeError,
     UPUnboundedVariablesError,
@@ -39,6 +38,19 @@ from unified_planning.model.mixins.timed_conds_effs import TimedCondsEffs
 class Action:
     """This is the `Action` interface."""
 
+    # grounding can build hundreds of thousands of actions; __slots__ avoids
+    # a per-instance __dict__ (DurativeAction still gets one through the
+    # unslotted TimedCondsEffs mixin)
+    __slots__ = (
+        "_environment",
+        "_name",
+        "_hash",
+        "_parameters",
+        "_em",
+        "_tc",
+        "_parameters_tuple",
+    )
+
     def __init__(
         self,
         _name: str,
@@ -48,6 +60,9 @@ class Action:
     ):
         self._environment = get_environment(_env)
         self._name = _name
+        # memoized __hash__ value; None until computed and reset to None by
+        # every mutation that changes the hashed state
+        self._hash: Optional[int] = None
         self._parameters: "OrderedDict[str, up.model.parameter.Parameter]" = (
             OrderedDict()
         )
@@ -57,17 +72,22 @@ class Action:
                 assert self._environment.type_manager.has_type(
                     t
                 ), "type of parameter does not belong to the same environment of the action"
-                self._parameters[n] = up.model.parameter.Parameter(
-                    n, t, self._environment
-                )
+                self._parameters[n] = self._environment._build_parameter(n, t)
         else:
             for n, t in kwargs.items():
                 assert self._environment.type_manager.has_type(
                     t
                 ), "type of parameter does not belong to the same environment of the action"
-                self._parameters[n] = up.model.parameter.Parameter(
-                    n, t, self._environment
-                )
+                self._parameters[n] = self._environment._build_parameter(n, t)
+        # hot construction paths go through the expression manager and type
+        # checker repeatedly; bind them once
+        self._em = self._environment.expression_manager
+        self._tc = self._environment.type_checker
+        # _parameters never changes after __init__, so the view returned by
+        # the parameters property can be built once
+        self._parameters_tuple: Tuple["up.model.parameter.Parameter", ...] = tuple(
+            self._parameters.values()
+        )
 
     def __eq__(self, oth: object) -> bool:
         raise NotImplementedError
@@ -78,6 +98,21 @@ class Action:
     def clone(self):
         raise NotImplementedError
 
+    def _clone_shell(self, cls: type) -> "Action":
+        """Returns an uninitialized `cls` instance sharing this action's
+        already-validated name and parameters; `clone` implementations use it
+        to skip the re-validation performed by `__init__`. `Parameter`
+        objects are immutable, so sharing them between clones is safe."""
+        new = cls.__new__(cls)
+        new._environment = self._environment
+        new._em = self._em
+        new._tc = self._tc
+        new._name = self._name
+        new._hash = None
+        new._parameters = self._parameters.copy()
+        new._parameters_tuple = self._parameters_tuple
+        return new
+
     @property
     def environment(self) -> Environment:
         """Returns this `Action` `Environment`."""
@@ -92,11 +127,12 @@ class Action:
     def name(self, new_name: str):
         """Sets the `Action` `name`."""
         self._name = new_name
+        self._hash = None
 
     @property
-    def parameters(self) -> List["up.model.parameter.Parameter"]:
-        """Returns the `list` of the `Action parameters`."""
-        return list(self._parameters.values())
+    def parameters(self) -> Tuple["up.model.parameter.Parameter", ...]:
+        """Returns the `Action parameters`."""
+        return self._parameters_tuple
 
     def parameter(self, name: str) -> "up.model.parameter.Parameter":
         """
@@ -141,10 +177,45 @@ class Action:
         """Returns `True` if the `Action` has `conditional effects`, `False` otherwise."""
         raise NotImplementedError
 
+    # With __slots__ the default pickle state lists subclass fields before
+    # _environment, so FNodes would be rebuilt before the expression
+    # manager's table during unpickling. Serialize the environment first so
+    # every FNode is reconstructed through it, as happened with __dict__.
+    def __getstate__(self):
+        state = {"_environment": self._environment}
+        for cls in type(self).__mro__:
+            for slot in getattr(cls, "__slots__", ()):
+                if slot != "_environment":
+                    try:
+                        state[slot] = getattr(self, slot)
+                    except AttributeError:
+                        pass
+        d = getattr(self, "__dict__", None)
+        if d:
+            state.update(d)
+        return state
+
+    def __setstate__(self, state):
+        for k, v in state.items():
+            setattr(self, k, v)
+
 
 class InstantaneousAction(Action):
     """Represents an instantaneous action."""
 
+    __slots__ = (
+        "_preconditions",
+        "_effects",
+        "_simulated_effect",
+        "_fluents_assigned",
+        "_fluents_inc_dec",
+        "_preconditions_set",
+        "_effect_key_set",
+        "_eq_cache",
+        "_cond_cache",
+        "_effects_shared",
+    )
+
     def __init__(
         self,
         _name: str,
@@ -162,32 +233,41 @@ class InstantaneousAction(Action):
         ] = {}
         # fluent_inc_dec is the set of the fluents that have an unconditional increase or decrease
         self._fluents_inc_dec: Set["up.model.fnode.FNode"] = set()
+        # mirror of _preconditions kept for O(1) duplicate checks; the list
+        # preserves the insertion order exposed by the preconditions property
+        self._preconditions_set: Set["up.model.fnode.FNode"] = set()
+        # (fluent, kind, value) keys whose conflict check already passed;
+        # repeating an identical effect cannot introduce a new conflict
+        self._effect_key_set: Set[
+            Tuple["up.model.fnode.FNode", "up.model.effect.EffectKind", "up.model.fnode.FNode"]
+        ] = set()
+        # lazily built (preconditions, effects) frozensets reused by __eq__;
+        # reset to None by every mutation of the underlying lists
+        self._eq_cache: Optional[Tuple[frozenset, frozenset]] = None
+        # lazily built (conditional, unconditional) effect lists reused by the
+        # classification properties; reset to None by every effect mutation
+        self._cond_cache: Optional[
+            Tuple[List["up.model.effect.Effect"], List["up.model.effect.Effect"]]
+        ] = None
+        # True while the effect containers are shared with a clone
+        # (copy-on-write); private copies are made by _unshare_effects
+        self._effects_shared: bool = False
+
     def __repr__(self) -> str:
-        s = []
-        s.append(f"action {self.name}")
-        first = True
-        for p in self.parameters:
-            if first:
-                s.append("(")
-                first = False
-            else:
-                s.append(", ")
-            s.append(str(p))
-        if not first:
-            s.append(")")
-        s.append(" {\n")
-        s.append("    preconditions = [\n")
-        for c in self.preconditions:
-            s.append(f"      {str(c)}\n")
-        s.append("    ]\n")
-        s.append("    effects = [\n")
-        for e in self.effects:
-            s.append(f"      {str(e)}\n")
-        s.append("    ]\n")
-        if self._simulated_effect is not None:
-            s.append(f"    simulated effect = {self._simulated_effect}\n")
-        s.append("  }")
-        return "".join(s)
+        params = f"({', '.join(map(str, self.parameters))})" if self.parameters else ""
+        preconditions = "".join(f"      {c}\n" for c in self.preconditions)
+        effects = "".join(f"      {e}\n" for e in self._effects)
+        simulated = (
+            ""
+            if self._simulated_effect is None
+            else f"    simulated effect = {self._simulated_effect}\n"
+        )
+        return (
+            f"action {self.name}{params} {{\n"
+            f"    preconditions = [\n{preconditions}    ]\n"
+            f"    effects = [\n{effects}    ]\n"
+            f"{simulated}  }}"
+        )
 
     def __eq__(self, oth: object) -> bool:
         if isinstance(oth, InstantaneousAction):
@@ -198,38 +278,73 @@ class InstantaneousAction(Action):
             )
             return (
                 cond
-                and set(self._preconditions) == set(oth._preconditions)
-                and set(self._effects) == set(oth._effects)
+                and self._eq_snapshot() == oth._eq_snapshot()
                 and self._simulated_effect == oth._simulated_effect
             )
         else:
             return False
 
+    def _eq_snapshot(self) -> Tuple[frozenset, frozenset]:
+        """Returns the (preconditions, effects) frozensets compared by
+        __eq__, built once and reused until the next mutation."""
+        snapshot = self._eq_cache
+        if snapshot is None:
+            snapshot = (frozenset(self._preconditions), frozenset(self._effects))
+            self._eq_cache = snapshot
+        return snapshot
+
     def __hash__(self) -> int:
-        res = hash(self._name)
-        for ap in self._parameters.items():
-            res += hash(ap)
-        for p in self._preconditions:
-            res += hash(p)
-        for e in self._effects:
-            res += hash(e)
-        res += hash(self._simulated_effect)
+        res = self._hash
+        if res is None:
+            res = hash(self._name)
+            for n, p in self._parameters.items():
+                # hash name and parameter directly instead of materializing
+                # the (name, parameter) tuple
+                res ^= hash(n) * 1000003 ^ hash(p)
+            for p in self._preconditions:
+                res += hash(p)
+            for e in self._effects:
+                res += hash(e)
+            res += hash(self._simulated_effect)
+            self._hash = res
         return res
 
     def clone(self):
-        new_params = OrderedDict(
-            (param_name, param.type) for param_name, param in self._parameters.items()
-        )
-        new_instantaneous_action = InstantaneousAction(
-            self._name, new_params, self._environment
-        )
+        new_instantaneous_action = self._clone_shell(InstantaneousAction)
+        new_instantaneous_action._eq_cache = None
+        new_instantaneous_action._cond_cache = None
         new_instantaneous_action._preconditions = self._preconditions[:]
-        new_instantaneous_action._effects = [e.clone() for e in self._effects]
-        new_instantaneous_action._fluents_assigned = self._fluents_assigned.copy()
-        new_instantaneous_action._fluents_inc_dec = self._fluents_inc_dec.copy()
-        new_instantaneous_action._simulated_effect = self._simulated_effect
+        new_instantaneous_action._preconditions_set = self._preconditions_set.copy()
+        self._share_effects_with(new_instantaneous_action)
         return new_instantaneous_action
 
+    def _share_effects_with(self, new: "InstantaneousAction"):
+        """Hands the effect containers to the clone by reference and flags
+        both sides as shared: private copies are only made by
+        _unshare_effects on the first mutation or on the first access that
+        exposes the Effect objects, keeping clone O(1) in the number of
+        effects."""
+        new._effects = self._effects
+        new._fluents_assigned = self._fluents_assigned
+        new._fluents_inc_dec = self._fluents_inc_dec
+        new._effect_key_set = self._effect_key_set
+        new._simulated_effect = self._simulated_effect
+        self._effects_shared = new._effects_shared = True
+
+    def _unshare_effects(self):
+        """Materializes private copies of the effect containers if they are
+        still shared with a clone. Callers of the effects properties may
+        mutate the returned Effect objects in place (the compilers do), so
+        sharing must also stop before any Effect escapes."""
+        if self._effects_shared:
+            self._effects = [e.clone() for e in self._effects]
+            self._fluents_assigned = self._fluents_assigned.copy()
+            self._fluents_inc_dec = self._fluents_inc_dec.copy()
+            self._effect_key_set = self._effect_key_set.copy()
+            self._eq_cache = None
+            self._cond_cache = None
+            self._effects_shared = False
+
     @property
     def preconditions(self) -> List["up.model.fnode.FNode"]:
         """Returns the `list` of the `Action` `preconditions`."""
@@ -238,10 +353,14 @@ class InstantaneousAction(Action):
     def clear_preconditions(self):
         """Removes all the `Action preconditions`"""
         self._preconditions = []
+        self._preconditions_set = set()
+        self._eq_cache = None
+        self._hash = None
 
     @property
     def effects(self) -> List["up.model.effect.Effect"]:
         """Returns the `list` of the `Action effects`."""
+        self._unshare_effects()
         return self._effects
 
     def clear_effects(self):
@@ -249,27 +368,46 @@ class InstantaneousAction(Action):
         self._effects = []
         self._fluents_assigned = {}
         self._fluents_inc_dec = set()
+        self._effect_key_set = set()
         self._simulated_effect = None
+        self._eq_cache = None
+        self._cond_cache = None
+        self._effects_shared = False
+        self._hash = None
 
     @property
     def conditional_effects(self) -> List["up.model.effect.Effect"]:
-        """Returns the `list` of the `action conditional effects`.
-
-        IMPORTANT NOTE: this property does some computation, so it should be called as
-        seldom as possible."""
-        return [e for e in self._effects if e.is_conditional()]
+        """Returns the `list` of the `action conditional effects`."""
+        self._unshare_effects()
+        return self._split_effects()[0][:]
 
     def is_conditional(self) -> bool:
         """Returns `True` if the `action` has `conditional effects`, `False` otherwise."""
-        return any(e.is_conditional() for e in self._effects)
+        return len(self._split_effects()[0]) > 0
 
     @property
     def unconditional_effects(self) -> List["up.model.effect.Effect"]:
-        """Returns the `list` of the `action unconditional effects`.
+        """Returns the `list` of the `action unconditional effects`."""
+        self._unshare_effects()
+        return self._split_effects()[1][:]
 
-        IMPORTANT NOTE: this property does some computation, so it should be called as
-        seldom as possible."""
-        return [e for e in self._effects if not e.is_conditional()]
+    def _split_effects(
+        self,
+    ) -> Tuple[List["up.model.effect.Effect"], List["up.model.effect.Effect"]]:
+        """Returns the (conditional, unconditional) split of the effects,
+        computed once and reused until the next effect mutation."""
+        split = self._cond_cache
+        if split is None:
+            conditional: List["up.model.effect.Effect"] = []
+            unconditional: List["up.model.effect.Effect"] = []
+            for e in self._effects:
+                if e.is_conditional():
+                    conditional.append(e)
+                else:
+                    unconditional.append(e)
+            split = (conditional, unconditional)
+            self._cond_cache = split
+        return split
 
     def add_precondition(
         self,
@@ -285,21 +423,37 @@ class InstantaneousAction(Action):
 
         :param precondition: The expression that must be added to the `action's preconditions`.
         """
-        (precondition_exp,) = self._environment.expression_manager.auto_promote(
-            precondition
-        )
-        assert self._environment.type_checker.get_type(precondition_exp).is_bool_type()
-        if precondition_exp == self._environment.expression_manager.TRUE():
+        em = self._em
+        (precondition_exp,) = em.auto_promote(precondition)
+        assert self._tc.get_type(precondition_exp).is_bool_type()
+        # TRUE() is interned by the expression manager, so identity suffices
+        if precondition_exp is em.TRUE():
             return
-        free_vars = self._environment.free_vars_oracle.get_free_variables(
-            precondition_exp
-        )
-        if len(free_vars) != 0:
-            raise UPUnboundedVariablesError(
-                f"The precondition {str(precondition_exp)} has unbounded variables:\n{str(free_vars)}"
+        # constants, parameters and fluents applied to constants/parameters
+        # cannot contain free variables, so the oracle walk can be skipped
+        if not (
+            precondition_exp.is_constant()
+            or precondition_exp.is_parameter_exp()
+            or (
+                precondition_exp.is_fluent_exp()
+                and all(
+                    a.is_constant() or a.is_parameter_exp()
+                    for a in precondition_exp.args
+                )
+            )
+        ):
+            free_vars = self._environment.free_vars_oracle.get_free_variables(
+                precondition_exp
             )
-        if precondition_exp not in self._preconditions:
+            if len(free_vars) != 0:
+                raise UPUnboundedVariablesError(
+                    f"The precondition {str(precondition_exp)} has unbounded variables:\n{str(free_vars)}"
+                )
+        if precondition_exp not in self._preconditions_set:
             self._preconditions.append(precondition_exp)
+            self._preconditions_set.add(precondition_exp)
+            self._eq_cache = None
+            self._hash = None
 
     def add_effect(
         self,
@@ -315,17 +469,24 @@ class InstantaneousAction(Action):
         :param condition: The `condition` in which this `effect` is applied; the default
             value is `True`.
         """
-        (
-            fluent_exp,
-            value_exp,
-            condition_exp,
-        ) = self._environment.expression_manager.auto_promote(fluent, value, condition)
+        em = self._em
+        if condition is True:
+            # unconditional effects are the common case; skip promoting and
+            # type-checking the literal True condition
+            fluent_exp, value_exp = em.auto_promote(fluent, value)
+            condition_exp = em.TRUE()
+        else:
+            fluent_exp, value_exp, condition_exp = em.auto_promote(
+                fluent, value, condition
+            )
+            if not self._tc.get_type(
+                condition_exp
+            ).is_bool_type():
+                raise UPTypeError("Effect condition is not a Boolean condition!")
         if not fluent_exp.is_fluent_exp():
             raise UPUsageError(
                 "fluent field of add_effect must be a Fluent or a FluentExp"
             )
-        if not self._environment.type_checker.get_type(condition_exp).is_bool_type():
-            raise UPTypeError("Effect condition is not a Boolean condition!")
         if not fluent_exp.type.is_compatible(value_exp.type):
             # Value is not assignable to fluent (its type is not a subset of the fluent's type).
             raise UPTypeError(
@@ -349,17 +510,22 @@ class InstantaneousAction(Action):
         :param condition: The `condition` in which this `effect` is applied; the default
             value is `True`.
         """
-        (
-            fluent_exp,
-            value_exp,
-            condition_exp,
-        ) = self._environment.expression_manager.auto_promote(fluent, value, condition)
+        em = self._em
+        if condition is True:
+            # unconditional effects are the common case; skip promoting and
+            # type-checking the literal True condition
+            fluent_exp, value_exp = em.auto_promote(fluent, value)
+            condition_exp = em.TRUE()
+        else:
+            fluent_exp, value_exp, condition_exp = em.auto_promote(
+                fluent, value, condition
+            )
+            if not condition_exp.type.is_bool_type():
+                raise UPTypeError("Effect condition is not a Boolean condition!")
         if not fluent_exp.is_fluent_exp():
             raise UPUsageError(
                 "fluent field of add_increase_effect must be a Fluent or a FluentExp"
             )
-        if not condition_exp.type.is_bool_type():
-            raise UPTypeError("Effect condition is not a Boolean condition!")
         if not fluent_exp.type.is_compatible(value_exp.type):
             raise UPTypeError(
                 f"InstantaneousAction effect has an incompatible value type. Fluent type: {fluent_exp.type} // Value type: {value_exp.type}"
@@ -389,17 +555,22 @@ class InstantaneousAction(Action):
         :param condition: The `condition` in which this `effect` is applied; the default
             value is `True`.
         """
-        (
-            fluent_exp,
-            value_exp,
-            condition_exp,
-        ) = self._environment.expression_manager.auto_promote(fluent, value, condition)
+        em = self._em
+        if condition is True:
+            # unconditional effects are the common case; skip promoting and
+            # type-checking the literal True condition
+            fluent_exp, value_exp = em.auto_promote(fluent, value)
+            condition_exp = em.TRUE()
+        else:
+            fluent_exp, value_exp, condition_exp = em.auto_promote(
+                fluent, value, condition
+            )
+            if not condition_exp.type.is_bool_type():
+                raise UPTypeError("Effect condition is not a Boolean condition!")
         if not fluent_exp.is_fluent_exp():
             raise UPUsageError(
                 "fluent field of add_decrease_effect must be a Fluent or a FluentExp"
             )
-        if not condition_exp.type.is_bool_type():
-            raise UPTypeError("Effect condition is not a Boolean condition!")
         if not fluent_exp.type.is_compatible(value_exp.type):
             raise UPTypeError(
                 f"InstantaneousAction effect has an incompatible value type. Fluent type: {fluent_exp.type} // Value type: {value_exp.type}"
@@ -419,15 +590,27 @@ class InstantaneousAction(Action):
         assert (
             effect.environment == self._environment
         ), "effect does not have the same environment of the action"
-        up.model.effect.check_conflicting_effects(
-            effect,
-            None,
-            self._simulated_effect,
-            self._fluents_assigned,
-            self._fluents_inc_dec,
-            "action",
-        )
+        self._unshare_effects()
+        # the conflict check is a no-op for conditional effects and boolean
+        # fluents, so only effects that actually run it are memoized; keying
+        # those no-ops would let a later identical-keyed unconditional effect
+        # skip the check without registering the fluent
+        if not effect._is_conditional and not effect.fluent.type.is_bool_type():
+            key = (effect.fluent, effect.kind, effect.value)
+            if key not in self._effect_key_set:
+                up.model.effect.check_conflicting_effects(
+                    effect,
+                    None,
+                    self._simulated_effect,
+                    self._fluents_assigned,
+                    self._fluents_inc_dec,
+                    "action",
+                )
+                self._effect_key_set.add(key)
         self._effects.append(effect)
+        self._eq_cache = None
+        self._cond_cache = None
+        self._hash = None
 
     @property
     def simulated_effect(self) -> Optional["up.model.effect.SimulatedEffect"]:
@@ -449,9 +632,13 @@ class InstantaneousAction(Action):
             "action",
         )
         self._simulated_effect = simulated_effect
+        self._hash = None
 
     def _set_preconditions(self, preconditions: List["up.model.fnode.FNode"]):
         self._preconditions = preconditions
+        self._preconditions_set = set(preconditions)
+        self._eq_cache = None
+        self._hash = None
 
 
 class DurativeAction(Action, TimedCondsEffs):
@@ -467,42 +654,30 @@ class DurativeAction(Action, TimedCondsEffs):
         Action.__init__(self, _name, _parameters, _env, **kwargs)
         TimedCondsEffs.__init__(self, _env)
         self._duration: "up.model.timing.DurationInterval" = (
-            up.model.timing.FixedDuration(self._environment.expression_manager.Int(0))
+            up.model.timing.FixedDuration(self._em.Int(0))
         )
 
     def __repr__(self) -> str:
-        s = []
-        s.append(f"durative action {self.name}")
-        first = True
-        for p in self.parameters:
-            if first:
-                s.append("(")
-                first = False
-            else:
-                s.append(", ")
-            s.append(str(p))
-        if not first:
-            s.append(")")
-        s.append(" {\n")
-        s.append(f"    duration = {str(self._duration)}\n")
-        s.append("    conditions = [\n")
-        for i, cl in self.conditions.items():
-            s.append(f"      {str(i)}:\n")
-            for c in cl:
-                s.append(f"        {str(c)}\n")
-        s.append("    ]\n")
-        s.append("    effects = [\n")
-        for t, el in self.effects.items():
-            s.append(f"      {str(t)}:\n")
-            for e in el:
-                s.append(f"        {str(e)}:\n")
-        s.append("    ]\n")
-        s.append("    simulated effects = [\n")
-        for t, se in self.simulated_effects.items():
-            s.append(f"      {str(t)}: {se}\n")
-        s.append("    ]\n")
-        s.append("  }")
-        return "".join(s)
+        params = f"({', '.join(map(str, self.parameters))})" if self.parameters else ""
+        conditions = "".join(
+            f"      {i}:\n" + "".join(f"        {c}\n" for c in cl)
+            for i, cl in self.conditions.items()
+        )
+        effects = "".join(
+            f"      {t}:\n" + "".join(f"        {e}:\n" for e in el)
+            for t, el in self.effects.items()
+        )
+        simulated = "".join(
+            f"      {t}: {se}\n" for t, se in self.simulated_effects.items()
+        )
+        return (
+            f"durative action {self.name}{params} {{\n"
+            f"    duration = {self._duration}\n"
+            f"    conditions = [\n{conditions}    ]\n"
+            f"    effects = [\n{effects}    ]\n"
+            f"    simulated effects = [\n{simulated}    ]\n"
+            f"  }}"
+        )
 
     def __eq__(self, oth: object) -> bool:
         if not isinstance(oth, DurativeAction):
@@ -520,16 +695,13 @@ class DurativeAction(Action, TimedCondsEffs):
 
     def __hash__(self) -> int:
         res = hash(self._name) + hash(self._duration)
-        for ap in self._parameters.items():
-            res += hash(ap)
+        for n, p in self._parameters.items():
+            res ^= hash(n) * 1000003 ^ hash(p)
         res += TimedCondsEffs.__hash__(self)
         return res
 
     def clone(self):
-        new_params = OrderedDict(
-            (param_name, param.type) for param_name, param in self._parameters.items()
-        )
-        new_durative_action = DurativeAction(self._name, new_params, self._environment)
+        new_durative_action = self._clone_shell(DurativeAction)
         new_durative_action._duration = self._duration
 
         TimedCondsEffs._clone_to(self, new_durative_action)
@@ -547,8 +719,8 @@ class DurativeAction(Action, TimedCondsEffs):
         :param duration: The new `duration interval` of this `action`.
         """
         lower, upper = duration.lower, duration.upper
-        tlower = self._environment.type_checker.get_type(lower)
-        tupper = self._environment.type_checker.get_type(upper)
+        tlower = self._tc.get_type(lower)
+        tupper = self._tc.get_type(upper)
         assert tlower.is_int_type() or tlower.is_real_type()
         assert tupper.is_int_type() or tupper.is_real_type()
         if (
@@ -566,6 +738,7 @@ class DurativeAction(Action, TimedCondsEffs):
                 f"{duration} is an empty interval duration of action: {self.name}."
             )
         self._duration = duration
+        self._hash = None
 
     def set_fixed_duration(self, value: Union["up.model.fnode.FNode", int, Fraction]):
         """
@@ -573,7 +746,7 @@ class DurativeAction(Action, TimedCondsEffs):
 
         :param value: The `value` set as both edges of this `action's duration`.
         """
-        (value_exp,) = self._environment.expression_manager.auto_promote(value)
+        (value_exp,) = self._em.auto_promote(value)
         self.set_duration_constraint(up.model.timing.FixedDuration(value_exp))
 
     def set_closed_duration_interval(
@@ -587,7 +760,7 @@ class DurativeAction(Action, TimedCondsEffs):
         :param lower: The value set as the lower edge of this `action's duration`.
         :param upper: The value set as the upper edge of this `action's duration`.
         """
-        lower_exp, upper_exp = self._environment.expression_manager.auto_promote(
+        lower_exp, upper_exp = self._em.auto_promote(
             lower, upper
         )
         self.set_duration_constraint(
@@ -607,7 +780,7 @@ class DurativeAction(Action, TimedCondsEffs):
 
         Note that `lower` and `upper` are not part of the interval.
         """
-        lower_exp, upper_exp = self._environment.expression_manager.auto_promote(
+        lower_exp, upper_exp = self._em.auto_promote(
             lower, upper
         )
         self.set_duration_constraint(
@@ -627,7 +800,7 @@ class DurativeAction(Action, TimedCondsEffs):
 
         Note that `lower` is not part of the interval.
         """
-        lower_exp, upper_exp = self._environment.expression_manager.auto_promote(
+        lower_exp, upper_exp = self._em.auto_promote(
             lower, upper
         )
         self.set_duration_constraint(
@@ -647,7 +820,7 @@ class DurativeAction(Action, TimedCondsEffs):
 
         Note that `upper` is not part of the interval.
         """
-        lower_exp, upper_exp = self._environment.expression_manager.auto_promote(
+        lower_exp, upper_exp = self._em.auto_promote(
             lower, upper
         )
         self.set_duration_constraint(
@@ -663,6 +836,8 @@ class DurativeAction(Action, TimedCondsEffs):
 class SensingAction(InstantaneousAction):
     """This class represents a sensing action."""
 
+    __slots__ = ("_observed_fluents", "_observed_set")
+
     def __init__(
         self,
         _name: str,
@@ -672,6 +847,8 @@ class SensingAction(InstantaneousAction):
     ):
         InstantaneousAction.__init__(self, _name, _parameters, _env, **kwargs)
         self._observed_fluents: List["up.model.fnode.FNode"] = []
+        # mirror of _observed_fluents kept for O(1) duplicate checks
+        self._observed_set: Set["up.model.fnode.FNode"] = set()
 
     def __eq__(self, oth: object) -> bool:
         if isinstance(oth, SensingAction):
@@ -682,22 +859,23 @@ class SensingAction(InstantaneousAction):
             return False
 
     def __hash__(self) -> int:
-        res = super().__hash__()
-        for of in self._observed_fluents:
-            res += hash(of)
+        res = self._hash
+        if res is None:
+            res = super().__hash__()
+            for of in self._observed_fluents:
+                res += hash(of)
+            self._hash = res
         return res
 
     def clone(self):
-        new_params = OrderedDict()
-        for param_name, param in self._parameters.items():
-            new_params[param_name] = param.type
-        new_sensing_action = SensingAction(self._name, new_params, self._environment)
+        new_sensing_action = self._clone_shell(SensingAction)
+        new_sensing_action._eq_cache = None
+        new_sensing_action._cond_cache = None
         new_sensing_action._preconditions = self._preconditions[:]
-        new_sensing_action._effects = [e.clone() for e in self._effects]
-        new_sensing_action._fluents_assigned = self._fluents_assigned.copy()
-        new_sensing_action._fluents_inc_dec = self._fluents_inc_dec.copy()
-        new_sensing_action._simulated_effect = self._simulated_effect
+        new_sensing_action._preconditions_set = self._preconditions_set.copy()
+        self._share_effects_with(new_sensing_action)
         new_sensing_action._observed_fluents = self._observed_fluents.copy()
+        new_sensing_action._observed_set = self._observed_set.copy()
         return new_sensing_action
 
     def add_observed_fluents(self, observed_fluents: List["up.model.fnode.FNode"]):
@@ -706,8 +884,14 @@ class SensingAction(InstantaneousAction):
 
         :param observed_fluents: The list of observed fluents that must be added.
         """
+        lst_append = self._observed_fluents.append
+        observed_set = self._observed_set
+        observed_add = observed_set.add
         for of in observed_fluents:
-            self.add_observed_fluent(of)
+            if of not in observed_set:
+                lst_append(of)
+                observed_add(of)
+        self._hash = None
 
     def add_observed_fluent(self, observed_fluent: "up.model.fnode.FNode"):
         """
@@ -715,7 +899,11 @@ class SensingAction(InstantaneousAction):
 
         :param observed_fluent: The observed fluent that must be added.
         """
+        if observed_fluent in self._observed_set:
+            return
         self._observed_fluents.append(observed_fluent)
+        self._observed_set.add(observed_fluent)
+        self._hash = None
 
     @property
     def observed_fluents(self) -> List["up.model.fnode.FNode"]:
@@ -724,17 +912,15 @@ class SensingAction(InstantaneousAction):
 
     def __repr__(self) -> str:
         b = InstantaneousAction.__repr__(self)[0:-3]
-        s = ["sensing-", b]
-        s.append("    observations = [\n")
-        for e in self._observed_fluents:
-            s.append(f"      {str(e)}\n")
-        s.append("    ]\n")
-        s.append("  }")
-        return "".join(s)
+        observations = "".join(f"      {e}\n" for e in self._observed_fluents)
+        return f"sensing-{b}    observations = [\n{observations}    ]\n  }}"
 
 
 class ProbabilisticAction(InstantaneousAction):
     """Represents an action with probabilistic effect."""
+
+    __slots__ = ("_probabilistic_effects", "_prob_fluent_index")
+
     def __init__(
             self,
             _name: str,
@@ -744,43 +930,51 @@ class ProbabilisticAction(InstantaneousAction):
     ):
         InstantaneousAction.__init__(self, _name, _parameters, _env, **kwargs)
         self._probabilistic_effects: List[up.model.effect.ProbabilisticEffect] = []
+        # maps each fluent expression to the index of the probabilistic
+        # effect modifying it, for O(1) conflict detection
+        self._prob_fluent_index: Dict["up.model.fnode.FNode", int] = {}
 
     def __repr__(self) -> str:
         b = InstantaneousAction.__repr__(self)[0:-3]
-        s = ["Probabilistic ", b]
-        s.append("    probabilistic effects = [\n")
-        for pe in self._probabilistic_effects:
-            s.append(f"      {str(pe)}\n")
-        s.append("    ]\n")
-        s.append("  }")
-        return "".join(s)
+        probabilistic = "".join(f"      {pe}\n" for pe in self._probabilistic_effects)
+        return f"Probabilistic {b}    probabilistic effects = [\n{probabilistic}    ]\n  }}"
 
     def __eq__(self, oth: object) -> bool:
         if isinstance(oth, ProbabilisticAction):
-            super().__eq__(oth) and set(self._probabilistic_effects) == set(
-                oth._probabilistic_effects)
+            return super().__eq__(oth) and set(self._probabilistic_effects) == set(
+                oth._probabilistic_effects
+            )
         else:
             return False
 
     def __hash__(self) -> int:
-        res = super().__hash__()
-        for pe in self._probabilistic_effects:
-            res += hash(pe)
+        res = self._hash
+        if res is None:
+            res = super().__hash__()
+            for pe in self._probabilistic_effects:
+                res += hash(pe)
+            self._hash = res
         return res
 
     def clone(self):
-        new_params = OrderedDict()
-        for param_name, param in self._parameters.items():
-            new_params[param_name] = param.type
-        new_probabilistic_action = ProbabilisticAction(self._name, new_params, self._environment)
+        new_probabilistic_action = self._clone_shell(ProbabilisticAction)
+        new_probabilistic_action._eq_cache = None
+        new_probabilistic_action._cond_cache = None
         new_probabilistic_action._preconditions = self._preconditions[:]
-        new_probabilistic_action._effects = [e.clone() for e in self._effects]
-        new_probabilistic_action._fluents_assigned = self._fluents_assigned.copy()
-        new_probabilistic_action._fluents_inc_dec = self._fluents_inc_dec.copy()
-        new_probabilistic_action._simulated_effect = self._simulated_effect
-        new_probabilistic_action._probabilistic_effects = [pe.clone() for pe in self._probabilistic_effects]
+        new_probabilistic_action._preconditions_set = self._preconditions_set.copy()
+        new_probabilistic_action._probabilistic_effects = self._probabilistic_effects
+        new_probabilistic_action._prob_fluent_index = self._prob_fluent_index
+        self._share_effects_with(new_probabilistic_action)
         return new_probabilistic_action
 
+    def _unshare_effects(self):
+        if self._effects_shared:
+            self._probabilistic_effects = [
+                pe.clone() for pe in self._probabilistic_effects
+            ]
+            self._prob_fluent_index = self._prob_fluent_index.copy()
+        InstantaneousAction._unshare_effects(self)
+
     def add_probabilistic_effect(
             self,
             fluents: List["up.model.fnode.FNode"],
@@ -798,12 +992,15 @@ class ProbabilisticAction(InstantaneousAction):
         :param fluents: The `fluents` of which `value` is modified by the `assignment`.
         :param probability_func: based on the probability function a value is chosen from the values param
         """
-
-
-        fluents_exp = self._environment.expression_manager.auto_promote(fluents)
-
-        for f in fluents_exp:
-            if not f.is_fluent_exp():
+        # callers usually pass already-built fluent expressions; skip the
+        # promotion and validation loop for them
+        if all(
+            type(f) is up.model.fnode.FNode and f.is_fluent_exp() for f in fluents
+        ):
+            fluents_exp = list(fluents)
+        else:
+            fluents_exp = self._em.auto_promote(fluents)
+            if not all(f.is_fluent_exp() for f in fluents_exp):
                 raise UPUsageError(
                     "fluent field of add_effect must be a Fluent or a FluentExp"
                 )
@@ -815,21 +1012,27 @@ class ProbabilisticAction(InstantaneousAction):
 
     def _add_probabilistic_effect_instance(self, probabilistic_effect: "up.model.effect.ProbabilisticEffect"):
         assert (
-                probabilistic_effect.environment() == self._environment
+                probabilistic_effect.environment() is self._environment
         ), "effect does not have the same environment of the action"
+        self._unshare_effects()
         up.model.effect.check_conflicting_probabilistic_effects(
             probabilistic_effect,
             None,
             self._simulated_effect,
             self._fluents_assigned,
             self._fluents_inc_dec,
-            self._probabilistic_effects,
+            self._prob_fluent_index,
             self._effects,
             "action",
         )
         self._probabilistic_effects.append(probabilistic_effect)
+        idx = len(self._probabilistic_effects) - 1
+        for f in probabilistic_effect.fluents:
+            self._prob_fluent_index[f] = idx
+        self._hash = None
     def probabilistic_effect(self) -> List["up.model.effect.ProbabilisticEffect"]:
         """Returns the `action` `probabilistic effect`."""
+        self._unshare_effects()
         return self._probabilistic_effects
 
     def set_probabilistic_effect(self, probabilistic_effect: "up.model.effect.ProbabilisticEffect"):
@@ -840,17 +1043,23 @@ class ProbabilisticAction(InstantaneousAction):
             `probabilistic effect`.
         """
         self._probabilistic_effects = [probabilistic_effect]
+        self._prob_fluent_index = {f: 0 for f in probabilistic_effect.fluents}
+        self._hash = None
 
     def clear_effects(self):
         """Removes all the `Action's effects`."""
         super().clear_effects()
         self._probabilistic_effects = []
+        self._prob_fluent_index = {}
 
 
 class FixDurationStartAction(InstantaneousAction):
     """Represents a start action with fix duration.
     This is the start action of the DurationProbabilisticAction action class
     _end_action - the end action of this start action """
+
+    __slots__ = ("_duration", "_end_action")
+
     def __init__(
             self,
             _name: str,
@@ -860,37 +1069,41 @@ class FixDurationStartAction(InstantaneousAction):
     ):
         InstantaneousAction.__init__(self, _name, _parameters, _env, **kwargs)
         self._duration: "up.model.timing.DurationInterval" = (
-            up.model.timing.FixedDuration(self._environment.expression_manager.Int(0)))
+            up.model.timing.FixedDuration(self._em.Int(0)))
         self._end_action: ProbabilisticAction = None
     def __repr__(self) -> str:
         b = InstantaneousAction.__repr__(self)[0:-3]
-        s = ["start durative probabilistic ", b]
-        s.append(f"    duration = {str(self._duration)}\n")
-        s.append(f" end action = {self._end_action.name}")
-        s.append("  }")
-        return "".join(s)
+        return (
+            f"start durative probabilistic {b}    duration = {self._duration}\n"
+            f" end action = {self._end_action.name}  }}"
+        )
 
     def __eq__(self, oth: object) -> bool:
         if isinstance(oth, FixDurationStartAction):
-            super().__eq__(oth) and \
-            self._duration == oth._duration and \
-                self._end_action == oth._end_action
+            return (
+                super().__eq__(oth)
+                and self._duration == oth._duration
+                and self._end_action == oth._end_action
+            )
         else:
             return False
 
     def __hash__(self) -> int:
-        return super().__hash__() + hash(self._duration) + self._end_action.__hash__()
+        res = self._hash
+        if res is None:
+            res = (
+                super().__hash__() + hash(self._duration) + self._end_action.__hash__()
+            )
+            self._hash = res
+        return res
 
     def clone(self):
-        new_params = OrderedDict()
-        for param_name, param in self._parameters.items():
-            new_params[param_name] = param.type
-        new_duration_start_action = FixDurationStartAction(self._name, new_params, self._environment)
+        new_duration_start_action = self._clone_shell(FixDurationStartAction)
+        new_duration_start_action._eq_cache = None
+        new_duration_start_action._cond_cache = None
         new_duration_start_action._preconditions = self._preconditions[:]
-        new_duration_start_action._effects = [e.clone() for e in self._effects]
-        new_duration_start_action._fluents_assigned = self._fluents_assigned.copy()
-        new_duration_start_action._fluents_inc_dec = self._fluents_inc_dec.copy()
-        new_duration_start_action._simulated_effect = self._simulated_effect
+        new_duration_start_action._preconditions_set = self._preconditions_set.copy()
+        self._share_effects_with(new_duration_start_action)
         new_duration_start_action._duration = self._duration
         new_duration_start_action._end_action = self._end_action.clone()
 
@@ -907,8 +1120,8 @@ class FixDurationStartAction(InstantaneousAction):
         :param duration: The new `duration interval` of this `action`.
         """
         lower, upper = duration.lower, duration.upper
-        tlower = self._environment.type_checker.get_type(lower)
-        tupper = self._environment.type_checker.get_type(upper)
+        tlower = self._tc.get_type(lower)
+        tupper = self._tc.get_type(upper)
         assert tlower.is_int_type() or tlower.is_real_type()
         assert tupper.is_int_type() or tupper.is_real_type()
         if (
@@ -926,18 +1139,20 @@ class FixDurationStartAction(InstantaneousAction):
                 f"{duration} is an empty interval duration of action: {self.name}."
             )
         self._duration = duration
+        self._hash = None
     def set_fixed_duration(self, value: Union["up.model.fnode.FNode", int, Fraction]):
         """
         Sets the `duration interval` for this `action` as the interval `[value, value]`.
 
         :param value: The `value` set as both edges of this `action's duration`.
         """
-        (value_exp,) = self._environment.expression_manager.auto_promote(value)
+        (value_exp,) = self._em.auto_promote(value)
         self.set_duration_constraint(up.model.timing.FixedDuration(value_exp))
 
     def set_end_action(self, end_action: ProbabilisticAction):
         """Returns the `end_action` `name`."""
         self._end_action = end_action
+        self._hash = None
 
     def end_action(self) -> ProbabilisticAction:
         """Returns the `end_action` `name`."""
@@ -957,6 +1172,8 @@ class DurationProbabilisticAction(Action):
     **** don't support conditional effect and simulated effect
     """
 
+    __slots__ = ("_start_action", "_end_action")
+
     def __init__(
             self,
             _name: str,
@@ -971,26 +1188,39 @@ class DurationProbabilisticAction(Action):
 
     def __repr__(self) -> str:
         b = Action.__repr__(self)[0:-3]
-        s = ["duration probabilistic-", b]
-        s.append(f"    start action = {self._start_action.__repr__()}\n")
-        s.append(f"    end action = {self._end_action.__repr__()}\n")
-        s.append("  }")
-        return "".join(s)
+        return (
+            f"duration probabilistic-{b}    start action = {self._start_action!r}\n"
+            f"    end action = {self._end_action!r}\n  }}"
+        )
 
     def __eq__(self, oth: object) -> bool:
         if isinstance(oth, DurationProbabilisticAction):
-            super().__eq__(oth) and self._start_action == oth._start_action and self._end_action == oth._end_action
+            # Action.__eq__ is abstract, so the base fields are compared
+            # directly, as DurativeAction does
+            return (
+                self._environment == oth._environment
+                and self._name == oth._name
+                and self._parameters == oth._parameters
+                and self._start_action == oth._start_action
+                and self._end_action == oth._end_action
+            )
         else:
             return False
 
     def __hash__(self) -> int:
-        return super().__hash__() + hash(self._start_action) + hash(self._end_action)
+        res = self._hash
+        if res is None:
+            res = hash(self._name)
+            for n, p in self._parameters.items():
+                res ^= hash(n) * 1000003 ^ hash(p)
+            res += hash(self._start_action) + hash(self._end_action)
+            self._hash = res
+        return res
 
     def clone(self):
-        new_params = OrderedDict()
-        for param_name, param in self._parameters.items():
-            new_params[param_name] = param.type
-        new_durative_probabilistic_action = DurationProbabilisticAction(self._name, new_params, self._environment)
+        new_durative_probabilistic_action = self._clone_shell(
+            DurationProbabilisticAction
+        )
         new_durative_probabilistic_action._start_action = self._start_action.clone()
         new_durative_probabilistic_action._end_action = self._end_action.clone()
         return new_durative_probabilistic_action
@@ -1008,6 +1238,7 @@ class DurationProbabilisticAction(Action):
     def clear_preconditions(self):
         """Removes all the `Action preconditions`"""
         self._start_action.clear_preconditions()
+        self._hash = None
 
     def during_activation_effects(self) -> List["up.model.effect.Effect"]:
         """Returns the `list` of the `Action effects`."""
@@ -1016,6 +1247,7 @@ class DurationProbabilisticAction(Action):
     def clear_during_activation_effects(self):
         """Removes all the `Action's effects`."""
         self._start_action.clear_effects()
+        self._hash = None
 
     def effects(self) -> List["up.model.effect.Effect"]:
         """Returns the `list` of the `Action effects`."""
@@ -1024,6 +1256,10 @@ class DurationProbabilisticAction(Action):
     def clear_effects(self):
         """Removes all the `Action's effects`."""
         self._end_action.clear_effects()
+        # the start action's memoized hash folds in the end action's hash,
+        # so it must be dropped whenever the end action changes
+        self._start_action._hash = None
+        self._hash = None
 
     def probabilistic_effect(self) -> List["up.model.effect.ProbabilisticEffect"]:
         """Returns the `action` `probabilistic effect`."""
@@ -1044,6 +1280,7 @@ class DurationProbabilisticAction(Action):
         :param precondition: The expression that must be added to the `action's preconditions`.
         """
         self._start_action.add_precondition(precondition)
+        self._hash = None
 
     def add_during_activation_effect(
         self,
@@ -1061,6 +1298,7 @@ class DurationProbabilisticAction(Action):
         """
 
         self._start_action.add_effect(fluent, value, condition)
+        self._hash = None
 
     def add_end_precondition(
             self,
@@ -1077,6 +1315,8 @@ class DurationProbabilisticAction(Action):
         :param precondition: The expression that must be added to the `action's preconditions`.
         """
         self._end_action.add_precondition(precondition)
+        self._start_action._hash = None
+        self._hash = None
     def add_effect(
         self,
         fluent: Union["up.model.fnode.FNode", "up.model.fluent.Fluent"],
@@ -1093,6 +1333,8 @@ class DurationProbabilisticAction(Action):
         """
 
         self._end_action.add_effect(fluent, value, condition)
+        self._start_action._hash = None
+        self._hash = None
 
     def add_probabilistic_effect(
             self,
@@ -1112,6 +1354,8 @@ class DurationProbabilisticAction(Action):
         :param probability_func: based on the probability function a value is chosen from the values param
         """
         self._end_action.add_probabilistic_effect(fluents, probability_func)
+        self._start_action._hash = None
+        self._hash = None
 
     def set_probabilistic_effect(self, probabilistic_effect: "up.model.effect.ProbabilisticEffect"):
         """
@@ -1121,9 +1365,12 @@ class DurationProbabilisticAction(Action):
             `probabilistic effect`.
         """
         self._end_action.set_probabilistic_effect(probabilistic_effect)
+        self._start_action._hash = None
+        self._hash = None
 
     def _set_preconditions(self, preconditions: List["up.model.fnode.FNode"]):
         self._start_action._set_preconditions(preconditions)
+        self._hash = None
 
     def duration(self) -> "up.model.timing.DurationInterval":
         """Returns the `action` `duration interval`."""
@@ -1136,6 +1383,7 @@ class DurationProbabilisticAction(Action):
         :param value: The `value` set as both edges of this `action's duration`.
         """
         self._start_action.set_fixed_duration(value)
+        self._hash = None
 
 
 def start_end_actions(problem, actions: List["up.model.Action.DurationProbabilisticAction"]):
@@ -1147,18 +1395,21 @@ def start_end_actions(problem, actions: List["up.model.Action.DurationProbabilis
         return :  action_occurs: 'Fluent', receives an action and determine if the action is occurring
                   objects: all the start-action objects (type DurativeProbabilisticAction)
      """
+    import unified_planning.shortcuts
+
     Action = up.shortcuts.UserType('DurativeProbabilisticAction')
     action_occurs = up.model.Fluent('action_occurs', up.shortcuts.BoolType(), a=Action)
-    objects = []
     problem.add_fluent(action_occurs, default_initial_value=False)
 
-    for a in actions:
-        start_a = up.model.Object("start-" + a.name, Action)
-        objects.append(start_a)
-        a.add_during_activation_effect(action_occurs(start_a), True)
-        a.add_end_precondition(action_occurs(start_a))
-        a.add_effect(action_occurs(start_a), False)
-        problem.add_object(start_a)
+    objects = [up.model.Object("start-" + a.name, Action) for a in actions]
+    problem.add_objects(objects)
+
+    for a, start_a in zip(actions, objects):
+        # the same fluent expression is used by all three updates
+        occurs_exp = action_occurs(start_a)
+        a.add_during_activation_effect(occurs_exp, True)
+        a.add_end_precondition(occurs_exp)
+        a.add_effect(occurs_exp, False)
 
     return action_occurs, objects
 
@@ -23,7 +23,6 @@ import unified_planning as up
 from unified_planning.exceptions import UPConflictingEffectsException
 from enum import Enum, auto
 from typing import List, Callable, Dict, Optional, Set, Tuple, Union
-import numpy as np
 import inspect as i
 
 
@@ -49,6 +48,10 @@ class Effect:
     is actually applied or not and an `EffectKind` that determines the semantic of the `Effect`.
     """
 
+    # effects are created once per ground-action effect, so the per-instance
+    # __dict__ is worth removing
+    __slots__ = ("_fluent", "_value", "_condition", "_kind", "_hash", "_is_conditional")
+
     def __init__(
         self,
         fluent: "up.model.fnode.FNode",
@@ -60,6 +63,11 @@ class Effect:
         self._value = value
         self._condition = condition
         self._kind = kind
+        # memoized __hash__ value; reset by set_value/set_condition
+        self._hash: Optional[int] = None
+        # the condition only changes through set_condition, so the
+        # conditionality of the effect can be cached
+        self._is_conditional = not condition.is_true()
         assert (
             fluent.environment == value.environment
             and value.environment == condition.environment
@@ -80,24 +88,31 @@ class Effect:
         return " ".join(s)
 
     def __eq__(self, oth: object) -> bool:
-        if isinstance(oth, Effect):
-            return (
-                self._fluent == oth._fluent
-                and self._value == oth._value
-                and self._condition == oth._condition
-                and self._kind == oth._kind
-            )
-        else:
+        if self is oth:
+            return True
+        # Effect has no subclasses, so the exact type check suffices and is
+        # cheaper than isinstance in the hot dict/set lookups
+        if type(oth) is not Effect:
             return False
-
-    def __hash__(self) -> int:
         return (
-            hash(self._fluent)
-            + hash(self._value)
-            + hash(self._condition)
-            + hash(self._kind)
+            self._kind is oth._kind
+            and self._fluent == oth._fluent
+            and self._value == oth._value
+            and self._condition == oth._condition
         )
 
+    def __hash__(self) -> int:
+        res = self._hash
+        if res is None:
+            res = (
+                hash(self._fluent)
+                + hash(self._value)
+                + hash(self._condition)
+                + hash(self._kind)
+            )
+            self._hash = res
+        return res
+
     def clone(self):
         new_effect = Effect(self._fluent, self._value, self._condition, self._kind)
         return new_effect
@@ -107,7 +122,7 @@ class Effect:
         Returns `True` if the `Effect` condition is not `True`; this means that the `Effect` might
         not always be applied but depends on the runtime evaluation of it's :func:`condition <unified_planning.model.Effect.condition>`.
         """
-        return not self._condition.is_true()
+        return self._is_conditional
 
     @property
     def fluent(self) -> "up.model.fnode.FNode":
@@ -126,6 +141,7 @@ class Effect:
         :param new_value: The `value` that will be set as this `effect's value`.
         """
         self._value = new_value
+        self._hash = None
 
     @property
     def condition(self) -> "up.model.fnode.FNode":
@@ -139,6 +155,8 @@ class Effect:
         :param new_condition: The expression set as this `effect's condition`.
         """
         self._condition = new_condition
+        self._hash = None
+        self._is_conditional = not new_condition.is_true()
 
     @property
     def kind(self) -> EffectKind:
@@ -171,6 +189,8 @@ class SimulatedEffect:
     in the given :class:`~unified_planning.model.ROState` for the specified `fluent` expressions.
     """
 
+    __slots__ = ("_fluents", "_fluents_set", "_function", "_hash")
+
     def __init__(
         self,
         fluents: List["up.model.fnode.FNode"],
@@ -183,37 +203,43 @@ class SimulatedEffect:
             List["up.model.fnode.FNode"],
         ],
     ):
-        for f in fluents:
-            if not f.is_fluent_exp():
-                raise up.exceptions.UPUsageError(
-                    "Simulated effects can be defined on fluent expressions with constant parameters"
-                )
-            for c in f.args:
-                if not (c.is_constant() or c.is_parameter_exp()):
-                    raise up.exceptions.UPUsageError(
-                        "Simulated effects can be defined on fluent expressions with constant parameters"
-                    )
-        self._fluents = fluents
+        # both violations share one message, so a single generator that
+        # stops at the first offending expression is enough
+        if any(
+            not f.is_fluent_exp()
+            or not all(c.is_constant() or c.is_parameter_exp() for c in f.args)
+            for f in fluents
+        ):
+            raise up.exceptions.UPUsageError(
+                "Simulated effects can be defined on fluent expressions with constant parameters"
+            )
+        self._fluents = tuple(fluents)
+        # frozenset mirror for the O(1) membership tests of the conflict checkers
+        self._fluents_set = frozenset(self._fluents)
         self._function = function
+        # fluents and function are never mutated; the hash can be memoized
+        self._hash: Optional[int] = None
 
     def __repr__(self) -> str:
-        return f"{self._fluents} := simulated"
+        return f"{list(self._fluents)} := simulated"
 
     def __eq__(self, oth: object) -> bool:
-        if isinstance(oth, SimulatedEffect):
-            return self._fluents == oth._fluents and self._function == oth._function
-        else:
+        if self is oth:
+            return True
+        if type(oth) is not SimulatedEffect:
             return False
+        return self._function == oth._function and self._fluents == oth._fluents
 
     def __hash__(self) -> int:
-        res = hash(self._function)
-        for f in self._fluents:
-            res += hash(f)
+        res = self._hash
+        if res is None:
+            res = hash(self._function) + sum(map(hash, self._fluents))
+            self._hash = res
         return res
 
     @property
-    def fluents(self) -> List["up.model.fnode.FNode"]:
-        """Returns the `list` of `Fluents Expressions` modified by this `SimulatedEffect`."""
+    def fluents(self) -> Tuple["up.model.fnode.FNode", ...]:
+        """Returns the `tuple` of `Fluents Expressions` modified by this `SimulatedEffect`."""
         return self._fluents
 
     @property
@@ -314,6 +340,79 @@ class ProbabilisticEffect:
 
 
 
+def _conflict_msg(
+    effect: Effect, timing: Optional["up.model.timing.Timing"], name: str, what: str
+) -> str:
+    """Builds the conflict error message; only called on the raise path."""
+    if timing is None:
+        return f"The effect {effect} is in conflict with the {what} already in the {name}."
+    return f"The effect {effect} at timing {timing} is in conflict with the {what} already in the {name}."
+
+
+def _check_assign_conflicts(
+    effect: Effect,
+    timing: Optional["up.model.timing.Timing"],
+    simulated_effect: Optional[SimulatedEffect],
+    fluents_assigned: Dict["up.model.fnode.FNode", "up.model.fnode.FNode"],
+    fluents_inc_dec: Set["up.model.fnode.FNode"],
+    name: str,
+):
+    fluent = effect.fluent
+    # if the same fluent is involved in an increase/decrease, raise exception
+    if fluent in fluents_inc_dec:
+        raise UPConflictingEffectsException(
+            _conflict_msg(effect, timing, name, "increase/decrease effects")
+        )
+    # if the same fluent is involved in a simulated effect
+    elif simulated_effect is not None and fluent in simulated_effect._fluents_set:
+        raise UPConflictingEffectsException(
+            _conflict_msg(effect, timing, name, "simulated effects")
+        )
+    else:
+        assigned_value = fluents_assigned.get(fluent, None)
+        # the same fluent is involved in another assign
+        if assigned_value is not None:
+            # if the 2 values are different, raise exception
+            value = effect.value
+            if assigned_value != value and not (
+                assigned_value.is_constant()
+                and value.is_constant()
+                and assigned_value.constant_value() == value.constant_value()
+            ):
+                raise UPConflictingEffectsException(
+                    _conflict_msg(effect, timing, name, "effects")
+                )
+        else:
+            fluents_assigned[fluent] = effect.value
+
+
+def _check_inc_dec_conflicts(
+    effect: Effect,
+    timing: Optional["up.model.timing.Timing"],
+    simulated_effect: Optional[SimulatedEffect],
+    fluents_assigned: Dict["up.model.fnode.FNode", "up.model.fnode.FNode"],
+    fluents_inc_dec: Set["up.model.fnode.FNode"],
+    name: str,
+):
+    fluent = effect.fluent
+    if fluent in fluents_assigned:
+        raise UPConflictingEffectsException(
+            _conflict_msg(effect, timing, name, "effects")
+        )
+    fluents_inc_dec.add(fluent)
+    if simulated_effect is not None and fluent in simulated_effect._fluents_set:
+        raise UPConflictingEffectsException(
+            _conflict_msg(effect, timing, name, "simulated effects")
+        )
+
+
+_KIND_HANDLERS = {
+    EffectKind.ASSIGN: _check_assign_conflicts,
+    EffectKind.INCREASE: _check_inc_dec_conflicts,
+    EffectKind.DECREASE: _check_inc_dec_conflicts,
+}
+
+
 def check_conflicting_effects(
     effect: Effect,
     timing: Optional["up.model.timing.Timing"],
@@ -340,60 +439,13 @@ def check_conflicting_effects(
     :param name: string used for better error indexing.
     :raises: UPConflictingException if the given effect is in conflict with the data structure around it.
     """
-    assigned_value = fluents_assigned.get(effect.fluent, None)
-    if not effect.is_conditional() and not effect.fluent.type.is_bool_type():
-        if effect.is_assignment():
-            # if the same fluent is involved in an increase/decrease, raise exception
-            if effect.fluent in fluents_inc_dec:
-                if timing is None:
-                    msg = f"The effect {effect} is in conflict with the increase/decrease effects already in the {name}."
-                else:
-                    msg = f"The effect {effect} at timing {timing} is in conflict with the increase/decrease effects already in the {name}."
-                raise UPConflictingEffectsException(msg)
-            # if the same fluent is involved in a simulated effect
-            elif (
-                simulated_effect is not None
-                and effect.fluent in simulated_effect.fluents
-            ):
-                if timing is None:
-                    msg = f"The effect {effect} is in conflict with the simulated effects already in the {name}."
-                else:
-                    msg = f"The effect {effect} at timing {timing} is in conflict with the simulated effects already in the {name}."
-                raise UPConflictingEffectsException(msg)
-            # the same fluent is involved in another assign
-            elif assigned_value is not None:
-                # if the 2 values are different, raise exception
-                if assigned_value != effect.value and not (
-                    assigned_value.is_constant()
-                    and effect.value.is_constant()
-                    and assigned_value.constant_value() == effect.value.constant_value()
-                ):
-                    if timing is None:
-                        msg = f"The effect {effect} is in conflict with the effects already in the {name}."
-                    else:
-                        msg = f"The effect {effect} at timing {timing} is in conflict with the effects already in the {name}."
-                    raise UPConflictingEffectsException(msg)
-            else:
-                fluents_assigned[effect.fluent] = effect.value
-        elif effect.is_increase() or effect.is_decrease():
-            if effect.fluent in fluents_assigned:
-                if timing is None:
-                    msg = f"The effect {effect} is in conflict with the effects already in the {name}."
-                else:
-                    msg = f"The effect {effect} at timing {timing} is in conflict with the effects already in the {name}."
-                raise UPConflictingEffectsException(msg)
-            fluents_inc_dec.add(effect.fluent)
-            if (
-                simulated_effect is not None
-                and effect.fluent in simulated_effect.fluents
-            ):
-                if timing is None:
-                    msg = f"The effect {effect} is in conflict with the simulated effects already in the {name}."
-                else:
-                    msg = f"The effect {effect} at timing {timing} is in conflict with the simulated effects already in the {name}."
-                raise UPConflictingEffectsException(msg)
-        else:
+    if not effect._is_conditional and not effect.fluent.type.is_bool_type():
+        handler = _KIND_HANDLERS.get(effect.kind)
+        if handler is None:
             raise NotImplementedError
+        handler(
+            effect, timing, simulated_effect, fluents_assigned, fluents_inc_dec, name
+        )
 
 
 def check_conflicting_simulated_effects(
@@ -431,7 +483,7 @@ def check_conflicting_probabilistic_effects(
     simulated_effect: Optional[SimulatedEffect],
     fluents_assigned: Dict["up.model.fnode.FNode", "up.model.fnode.FNode"],
     fluents_inc_dec: Set["up.model.fnode.FNode"],
-    probabilistic_effects: List[ProbabilisticEffect],
+    prob_fluent_index: Dict["up.model.fnode.FNode", int],
     effects: List[Effect],
 
     name: str,
@@ -448,7 +500,8 @@ def check_conflicting_probabilistic_effects(
         same instant of the given simulated_effect.
     :param fluents_inc_dec: The set of fluents being increased or decremented in the same instant
         of the given simulated_effect.
-    :param probabilistic_effects: The list of probabilistic effects that happens in the same moment of the effect.
+    :param prob_fluent_index: The mapping from a fluent to the index of the probabilistic effect
+        modifying it, among the probabilistic effects that happen in the same moment of the effect.
     :param effects: The list of effects that happens in the same moment of the effect.
     :param name: string used for better error indexing.
     :raises: UPConflictingException if the given simulated_effect is in conflict with the data structure around it.
@@ -464,7 +517,7 @@ def check_conflicting_probabilistic_effects(
 
         elif (
                 simulated_effect is not None
-                and f in simulated_effect.fluents
+                and f in simulated_effect._fluents_set
         ):
             if timing is None:
                 msg = f"The effect {probabilistic_effect} is in conflict with the simulated effects already in the {name}."
@@ -485,10 +538,9 @@ def check_conflicting_probabilistic_effects(
                 raise UPConflictingEffectsException(msg)
 
         elif (
-                probabilistic_effects
+                prob_fluent_index
         ):
-            probabilistic__effects_fluents = list(np.concatenate([effect.fluents for effect in probabilistic_effects]).flat)
-            if f in probabilistic__effects_fluents:
+            if f in prob_fluent_index:
                 if timing is None:
                     msg = f"The effect {probabilistic_effect} is in conflict with the probabilistic_ effects already in the {name}."
                 else:
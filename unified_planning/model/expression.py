@@ -24,7 +24,7 @@ import unified_planning.model.types
 from unified_planning.model.operators import OperatorKind
 from unified_planning.exceptions import UPTypeError, UPExpressionDefinitionError
 from fractions import Fraction
-from typing import Optional, Iterable, List, Union, Dict, Tuple
+from typing import FrozenSet, Optional, Iterable, List, Union, Dict, Tuple
 
 Expression = Union[
     "up.model.fnode.FNode",
@@ -59,6 +59,15 @@ class ExpressionManager(object):
             "up.model.fnode.FNodeContent", "up.model.fnode.FNode"
         ] = {}
         self._next_free_id = 1
+        # substitution results shared by every Substituter built on this
+        # environment, keyed by the expression and the substitution pairs
+        self._substituter_cache: Dict[
+            Tuple[
+                "up.model.fnode.FNode",
+                FrozenSet[Tuple["up.model.fnode.FNode", "up.model.fnode.FNode"]],
+            ],
+            "up.model.fnode.FNode",
+        ] = {}
 
         self.true_expression = self.create_node(
             node_type=OperatorKind.BOOL_CONSTANT, args=tuple(), payload=True
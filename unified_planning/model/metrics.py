@@ -27,7 +27,15 @@ class PlanQualityMetric:
     problem goals, but also the problem's quality metric.
     """
 
-    pass
+    __slots__ = ()
+
+    # class-name hash shared by every instance; the subclasses' __hash__
+    # methods return it instead of re-hashing the name string per call
+    _HASH = hash("PlanQualityMetric")
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._HASH = hash(cls.__name__)
 
 
 class MinimizeActionCosts(PlanQualityMetric):
@@ -37,6 +45,8 @@ class MinimizeActionCosts(PlanQualityMetric):
     The costs for each `Action` of the problem is stored in this quality metric.
     """
 
+    __slots__ = ("costs", "default")
+
     def __init__(
         self,
         costs: Dict["up.model.Action", Optional["up.model.FNode"]],
@@ -58,7 +68,7 @@ class MinimizeActionCosts(PlanQualityMetric):
         )
 
     def __hash__(self):
-        return hash(self.__class__.__name__)
+        return self._HASH
 
     def get_action_cost(self, action: "up.model.Action") -> Optional["up.model.FNode"]:
         """
@@ -74,6 +84,8 @@ class MinimizeActionCosts(PlanQualityMetric):
 class MinimizeSequentialPlanLength(PlanQualityMetric):
     """This metric means that the number of :func:`actions <unified_planning.plans.SequentialPlan.actions>` in the resulting :class:`~unified_planning.plans.SequentialPlan` must be minimized."""
 
+    __slots__ = ()
+
     def __repr__(self):
         return "minimize sequential-plan-length"
 
@@ -81,12 +93,14 @@ class MinimizeSequentialPlanLength(PlanQualityMetric):
         return isinstance(other, MinimizeSequentialPlanLength)
 
     def __hash__(self):
-        return hash(self.__class__.__name__)
+        return self._HASH
 
 
 class MinimizeMakespan(PlanQualityMetric):
     """This metric means #TODO: explain what that metric means."""
 
+    __slots__ = ()
+
     def __repr__(self):
         return "minimize makespan"
 
@@ -94,7 +108,7 @@ class MinimizeMakespan(PlanQualityMetric):
         return isinstance(other, MinimizeMakespan)
 
     def __hash__(self):
-        return hash(self.__class__.__name__)
+        return self._HASH
 
 
 class MinimizeExpressionOnFinalState(PlanQualityMetric):
@@ -103,6 +117,8 @@ class MinimizeExpressionOnFinalState(PlanQualityMetric):
     following the given :class:`~unified_planning.model.Plan`.
     """
 
+    __slots__ = ("expression",)
+
     def __init__(self, expression: "up.model.FNode"):
         self.expression = expression
 
@@ -116,7 +132,7 @@ class MinimizeExpressionOnFinalState(PlanQualityMetric):
         )
 
     def __hash__(self):
-        return hash(self.__class__.__name__)
+        return self._HASH
 
 
 class MaximizeExpressionOnFinalState(PlanQualityMetric):
@@ -125,6 +141,8 @@ class MaximizeExpressionOnFinalState(PlanQualityMetric):
     following the given :class:`~unified_planning.model.Plan`.
     """
 
+    __slots__ = ("expression",)
+
     def __init__(self, expression: "up.model.FNode"):
         self.expression = expression
 
@@ -138,7 +156,7 @@ class MaximizeExpressionOnFinalState(PlanQualityMetric):
         )
 
     def __hash__(self):
-        return hash(self.__class__.__name__)
+        return self._HASH
 
 
 class Oversubscription(PlanQualityMetric):
@@ -148,11 +166,15 @@ class Oversubscription(PlanQualityMetric):
     The gained value for each fulfilled `goal` of the problem is stored in this quality metric.
     """
 
+    __slots__ = ("goals",)
+
     def __init__(self, goals: Dict["up.model.FNode", Union[Fraction, int]]):
-        goals = dict(
-            (k, f.numerator if f.denominator == 1 else f) for (k, f) in goals.items()
-        )
-        self.goals = goals
+        # integer gains are stored as they are; whole-valued Fractions are
+        # collapsed to their numerator
+        self.goals = {
+            k: f if type(f) is int else (f.numerator if f.denominator == 1 else f)
+            for k, f in goals.items()
+        }
 
     def __repr__(self):
         return f"oversubscription planning goals: {self.goals}"
@@ -161,7 +183,7 @@ class Oversubscription(PlanQualityMetric):
         return isinstance(other, Oversubscription) and self.goals == other.goals
 
     def __hash__(self):
-        return hash(self.__class__.__name__)
+        return self._HASH
 
 
 class TemporalOversubscription(PlanQualityMetric):
@@ -171,6 +193,8 @@ class TemporalOversubscription(PlanQualityMetric):
     The gained value for each fulfilled `goal` of the problem is stored in this quality metric.
     """
 
+    __slots__ = ("goals",)
+
     def __init__(
         self,
         goals: Dict[
@@ -178,10 +202,10 @@ class TemporalOversubscription(PlanQualityMetric):
             Union[Fraction, int],
         ],
     ):
-        goals = dict(
-            (k, f.numerator if f.denominator == 1 else f) for (k, f) in goals.items()
-        )
-        self.goals = goals
+        self.goals = {
+            k: f if type(f) is int else (f.numerator if f.denominator == 1 else f)
+            for k, f in goals.items()
+        }
 
     def __repr__(self):
         return f"oversubscription planning timed goals: {self.goals}"
@@ -190,4 +214,4 @@ class TemporalOversubscription(PlanQualityMetric):
         return isinstance(other, TemporalOversubscription) and self.goals == other.goals
 
     def __hash__(self):
-        return hash(self.__class__.__name__)
+        return self._HASH
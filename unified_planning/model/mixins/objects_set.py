@@ -17,7 +17,7 @@ from warnings import warn
 import unified_planning as up
 from unified_planning.model.types import _UserType
 from unified_planning.exceptions import UPProblemDefinitionError, UPValueError
-from typing import Iterator, List, Union, Optional, cast
+from typing import Dict, Iterator, List, Tuple, Union, Optional, cast
 
 
 class ObjectsSetMixin:
@@ -34,6 +34,10 @@ class ObjectsSetMixin:
         self._add_user_type_method = add_user_type_method
         self._has_name_method = has_name_method
         self._objects: List["up.model.object.Object"] = []
+        # objects grouped by compatible type, rebuilt lazily after mutations
+        self._objects_by_type_cache: Dict[
+            "up.model.types.Type", Tuple["up.model.object.Object", ...]
+        ] = {}
 
     @property
     def environment(self) -> "up.environment.Environment":
@@ -81,6 +85,7 @@ class ObjectsSetMixin:
                 warn(msg)
             raise UPProblemDefinitionError()
         self._objects.append(obj)
+        self._objects_by_type_cache.clear()
         if obj.type.is_user_type():
             self._add_user_type_method(obj.type)
         return obj
@@ -127,12 +132,18 @@ class ObjectsSetMixin:
         `type` and its heirs.
 
         :param typename: The target `type` of the `objects` that are retrieved.
-        :return: A generator of all the `objects` in the `problem` that are compatible with the
+        :return: An iterator over all the `objects` in the `problem` that are compatible with the
             given `type`.
         """
-        for obj in self._objects:
-            if cast(_UserType, obj.type).is_subtype(typename):
-                yield obj
+        res = self._objects_by_type_cache.get(typename)
+        if res is None:
+            res = tuple(
+                obj
+                for obj in self._objects
+                if cast(_UserType, obj.type).is_subtype(typename)
+            )
+            self._objects_by_type_cache[typename] = res
+        return iter(res)
 
     @property
     def all_objects(self) -> List["up.model.object.Object"]:
@@ -149,3 +160,4 @@ class ObjectsSetMixin:
 
     def _clone_to(self, other: "ObjectsSetMixin"):
         other._objects = self._objects.copy()
+        other._objects_by_type_cache = {}
@@ -14,45 +14,54 @@ class TimedCondsEffs:
 
     def __init__(self, _env: Optional[Environment] = None):
         self._environment = get_environment(_env)
-        self._conditions: Dict[
-            "up.model.timing.TimeInterval", List["up.model.fnode.FNode"]
-        ] = {}
-        self._effects: Dict[
-            "up.model.timing.Timing", List["up.model.effect.Effect"]
-        ] = {}
-        self._simulated_effects: Dict[
-            "up.model.timing.Timing", "up.model.effect.SimulatedEffect"
-        ] = {}
-        self._fluents_assigned: Dict[
-            "up.model.timing.Timing",
-            Dict["up.model.fnode.FNode", "up.model.fnode.FNode"],
-        ] = {}
-        self._fluents_inc_dec: Dict[
-            "up.model.timing.Timing", Set["up.model.fnode.FNode"]
-        ] = {}
+        # the containers are allocated lazily on first use: many durative
+        # actions only ever set a duration and never touch some of them
+        self._conditions: Optional[
+            Dict["up.model.timing.TimeInterval", List["up.model.fnode.FNode"]]
+        ] = None
+        self._effects: Optional[
+            Dict["up.model.timing.Timing", List["up.model.effect.Effect"]]
+        ] = None
+        self._simulated_effects: Optional[
+            Dict["up.model.timing.Timing", "up.model.effect.SimulatedEffect"]
+        ] = None
+        self._fluents_assigned: Optional[
+            Dict[
+                "up.model.timing.Timing",
+                Dict["up.model.fnode.FNode", "up.model.fnode.FNode"],
+            ]
+        ] = None
+        self._fluents_inc_dec: Optional[
+            Dict["up.model.timing.Timing", Set["up.model.fnode.FNode"]]
+        ] = None
 
     def __eq__(self, oth: object) -> bool:
         if isinstance(oth, TimedCondsEffs):
             if self._environment != oth._environment:
                 return False
-            if len(self._conditions) != len(oth._conditions):
+            conditions = self._conditions or {}
+            oth_conditions = oth._conditions or {}
+            if len(conditions) != len(oth_conditions):
                 return False
-            for i, cl in self._conditions.items():
-                oth_cl = oth._conditions.get(i, None)
+            for i, cl in conditions.items():
+                oth_cl = oth_conditions.get(i, None)
                 if oth_cl is None:
                     return False
                 elif set(cl) != set(oth_cl):
                     return False
-            if len(self._effects) != len(oth._effects):
+            effects = self._effects or {}
+            oth_effects = oth._effects or {}
+            if len(effects) != len(oth_effects):
                 return False
-            for t, el in self._effects.items():
-                oth_el = oth._effects.get(t, None)
+            for t, el in effects.items():
+                oth_el = oth_effects.get(t, None)
                 if oth_el is None:
                     return False
                 elif set(el) != set(oth_el):
                     return False
-            for t, se in self._simulated_effects.items():
-                oth_se = oth._simulated_effects.get(t, None)
+            oth_simulated_effects = oth._simulated_effects or {}
+            for t, se in (self._simulated_effects or {}).items():
+                oth_se = oth_simulated_effects.get(t, None)
                 if oth_se is None:
                     return False
                 elif se != oth_se:
@@ -63,15 +72,15 @@ class TimedCondsEffs:
 
     def __hash__(self) -> int:
         res = 0
-        for i, cl in self._conditions.items():
+        for i, cl in (self._conditions or {}).items():
             res += hash(i)
             for c in cl:
                 res += hash(c)
-        for t, el in self._effects.items():
+        for t, el in (self._effects or {}).items():
             res += hash(t)
             for e in el:
                 res += hash(e)
-        for t, se in self._simulated_effects.items():
+        for t, se in (self._simulated_effects or {}).items():
             res += hash(t) + hash(se)
         return res
 
@@ -81,16 +90,33 @@ class TimedCondsEffs:
         return new
 
     def _clone_to(self, other: "TimedCondsEffs"):
-        """Transfers deep copies of all `self` attributes into `other`"""
-        other._conditions = {t: cl[:] for t, cl in self._conditions.items()}
-        other._effects = {t: [e.clone() for e in el] for t, el in self._effects.items()}
-        other._simulated_effects = {t: se for t, se in self._simulated_effects.items()}
-        other._fluents_assigned = {
-            t: d.copy() for t, d in self._fluents_assigned.items()
-        }
-        other._fluents_inc_dec = {
-            t: fs.copy() for t, fs in self._fluents_inc_dec.items()
-        }
+        """Transfers deep copies of all `self` attributes into `other`;
+        containers never allocated in `self` stay unallocated in `other`."""
+        other._conditions = (
+            None
+            if self._conditions is None
+            else {t: cl[:] for t, cl in self._conditions.items()}
+        )
+        other._effects = (
+            None
+            if self._effects is None
+            else {t: [e.clone() for e in el] for t, el in self._effects.items()}
+        )
+        other._simulated_effects = (
+            None
+            if self._simulated_effects is None
+            else {t: se for t, se in self._simulated_effects.items()}
+        )
+        other._fluents_assigned = (
+            None
+            if self._fluents_assigned is None
+            else {t: d.copy() for t, d in self._fluents_assigned.items()}
+        )
+        other._fluents_inc_dec = (
+            None
+            if self._fluents_inc_dec is None
+            else {t: fs.copy() for t, fs in self._fluents_inc_dec.items()}
+        )
 
     @property
     def conditions(
@@ -101,11 +127,13 @@ class TimedCondsEffs:
         indicating that for this `action` to be applicable, during the whole `TimeInterval`
         set as `key`, all the `expression` in the `mapped list` must evaluate to `True`.
         """
+        if self._conditions is None:
+            self._conditions = {}
         return self._conditions
 
     def clear_conditions(self):
         """Removes all `conditions`."""
-        self._conditions = {}
+        self._conditions = None
 
     @property
     def effects(self) -> Dict["up.model.timing.Timing", List["up.model.effect.Effect"]]:
@@ -114,14 +142,16 @@ class TimedCondsEffs:
         indicating that, when the action is applied, all the `Effects` must be applied at the
         `Timing` set as `key` in the map.
         """
+        if self._effects is None:
+            self._effects = {}
         return self._effects
 
     def clear_effects(self):
         """Removes all `effects` from the `Action`."""
-        self._effects = {}
-        self._fluents_assigned = {}
-        self._fluents_inc_dec = {}
-        self._simulated_effects = {}
+        self._effects = None
+        self._fluents_assigned = None
+        self._fluents_inc_dec = None
+        self._simulated_effects = None
 
     @property
     def conditional_effects(
@@ -134,7 +164,7 @@ class TimedCondsEffs:
         seldom as possible.
         """
         retval: Dict[up.model.timing.Timing, List[up.model.effect.Effect]] = {}
-        for timing, effect_list in self._effects.items():
+        for timing, effect_list in (self._effects or {}).items():
             cond_effect_list = [e for e in effect_list if e.is_conditional()]
             if len(cond_effect_list) > 0:
                 retval[timing] = cond_effect_list
@@ -151,7 +181,7 @@ class TimedCondsEffs:
         seldom as possible.
         """
         retval: Dict[up.model.timing.Timing, List[up.model.effect.Effect]] = {}
-        for timing, effect_list in self._effects.items():
+        for timing, effect_list in (self._effects or {}).items():
             uncond_effect_list = [e for e in effect_list if not e.is_conditional()]
             if len(uncond_effect_list) > 0:
                 retval[timing] = uncond_effect_list
@@ -159,7 +189,9 @@ class TimedCondsEffs:
 
     def is_conditional(self) -> bool:
         """Returns `True` if the `action` has `conditional effects`, `False` otherwise."""
-        return any(e.is_conditional() for l in self._effects.values() for e in l)
+        return any(
+            e.is_conditional() for l in (self._effects or {}).values() for e in l
+        )
 
     def add_condition(
         self,
@@ -184,6 +216,8 @@ class TimedCondsEffs:
             interval = up.model.TimePointInterval(interval)
         (condition_exp,) = self._environment.expression_manager.auto_promote(condition)
         assert self._environment.type_checker.get_type(condition_exp).is_bool_type()
+        if self._conditions is None:
+            self._conditions = {}
         conditions = self._conditions.setdefault(interval, [])
         if condition_exp not in conditions:
             conditions.append(condition_exp)
@@ -193,6 +227,8 @@ class TimedCondsEffs:
         interval: "up.model.timing.TimeInterval",
         conditions: List["up.model.fnode.FNode"],
     ):
+        if self._conditions is None:
+            self._conditions = {}
         self._conditions[interval] = conditions
 
     def add_effect(
@@ -322,9 +358,19 @@ class TimedCondsEffs:
         assert (
             self._environment == effect.environment
         ), "effect does not have the same environment of the action"
+        if self._fluents_assigned is None:
+            self._fluents_assigned = {}
+        if self._fluents_inc_dec is None:
+            self._fluents_inc_dec = {}
+        if self._effects is None:
+            self._effects = {}
         fluents_assigned = self._fluents_assigned.setdefault(timing, {})
         fluents_inc_dec = self._fluents_inc_dec.setdefault(timing, set())
-        simulated_effect = self._simulated_effects.get(timing, None)
+        simulated_effect = (
+            self._simulated_effects.get(timing, None)
+            if self._simulated_effects is not None
+            else None
+        )
         up.model.effect.check_conflicting_effects(
             effect,
             timing,
@@ -340,6 +386,8 @@ class TimedCondsEffs:
         self,
     ) -> Dict["up.model.timing.Timing", "up.model.effect.SimulatedEffect"]:
         """Returns the `action` `simulated effects`."""
+        if self._simulated_effects is None:
+            self._simulated_effects = {}
         return self._simulated_effects
 
     def set_simulated_effect(
@@ -353,11 +401,17 @@ class TimedCondsEffs:
         :param timing: The time in which the `simulated effect` must be applied.
         :param simulated effects: The `simulated effect` that must be applied at the given `timing`.
         """
+        if self._fluents_assigned is None:
+            self._fluents_assigned = {}
+        if self._simulated_effects is None:
+            self._simulated_effects = {}
         up.model.effect.check_conflicting_simulated_effects(
             simulated_effect,
             timing,
             self._fluents_assigned.setdefault(timing, {}),
-            self._fluents_inc_dec.get(timing, set()),
+            self._fluents_inc_dec.get(timing, set())
+            if self._fluents_inc_dec is not None
+            else set(),
             f"action or problem: {self.name}",  # type: ignore[attr-defined]
         )
         self._simulated_effects[timing] = simulated_effect
@@ -22,23 +22,37 @@ from unified_planning.model.fnode import FNode
 from unified_planning.model.operators import OperatorKind
 from unified_planning.model.expression import Expression
 from unified_planning.exceptions import UPTypeError
-from typing import List, Dict
+from typing import FrozenSet, List, Dict, Optional, Tuple
 
 
 class Substituter(IdentityDagWalker):
     """Performs substitution into an expression"""
 
+    # max number of memoized (expression, substitutions) results; the cache
+    # is dropped entirely when it fills up
+    _SUBS_CACHE_SIZE = 4096
+
     def __init__(self, environment: "unified_planning.environment.Environment"):
         IdentityDagWalker.__init__(self, environment, True)
         self.environment = environment
         self.manager = environment.expression_manager
         self.type_checker = environment.type_checker
+        # memoized results of substitute, keyed by the expression and the
+        # promoted substitution pairs; FNodes are interned per environment,
+        # so the same key always denotes the same substitution. The cache
+        # lives on the expression manager so that every Substituter built
+        # on this environment shares the same table.
+        self._subs_cache: Dict[
+            Tuple[FNode, FrozenSet[Tuple[FNode, FNode]]], FNode
+        ] = self.manager._substituter_cache
 
     def _get_key(self, expression, **kwargs):
         return expression
 
     def substitute(
-        self, expression: FNode, substitutions: Dict[Expression, Expression] = {}
+        self,
+        expression: FNode,
+        substitutions: Optional[Dict[Expression, Expression]] = None,
     ) -> FNode:
         """
         Performs substitution into the given expression.
@@ -70,7 +84,7 @@ class Substituter(IdentityDagWalker):
         substitute(f, subs) = c
         """
 
-        if len(substitutions) == 0:
+        if not substitutions:
             return expression
         new_substitutions: Dict[FNode, FNode] = {}
         for k, v in substitutions.items():
@@ -81,18 +95,32 @@ class Substituter(IdentityDagWalker):
                 raise UPTypeError(
                     f"The expression type of {str(k)} is not compatible with the given substitution {str(v)}"
                 )
-        return self.walk(expression, subs=new_substitutions)
+        # a key matching the whole expression substitutes it directly and
+        # an untouched constant substitutes to itself; neither needs a walk
+        res = new_substitutions.get(expression)
+        if res is not None:
+            return res
+        if expression.is_constant() or expression.is_parameter_exp():
+            return expression
+        key = (expression, frozenset(new_substitutions.items()))
+        res = self._subs_cache.get(key)
+        if res is None:
+            res = self.walk(expression, subs=new_substitutions)
+            if len(self._subs_cache) >= self._SUBS_CACHE_SIZE:
+                self._subs_cache.clear()
+            self._subs_cache[key] = res
+        return res
 
     @walkers.handles(OperatorKind)
     def walk_replace_or_identity(
         self,
         expression: FNode,
         args: List[FNode],
-        subs: Dict[FNode, FNode] = {},
+        subs: Optional[Dict[FNode, FNode]] = None,
         **kwargs,
     ) -> FNode:
-        res = subs.get(expression, None)
-        if res is not None:
-            return res
-        else:
-            return IdentityDagWalker.super(self, expression, args, **kwargs)
+        if subs is not None:
+            res = subs.get(expression, None)
+            if res is not None:
+                return res
+        return IdentityDagWalker.super(self, expression, args, **kwargs)
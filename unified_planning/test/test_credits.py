@@ -14,7 +14,7 @@
 
 
 import sys
-from io1 import StringIO
+from io import StringIO
 import unified_planning
 from unified_planning.shortcuts import *
 from unified_planning.test import TestCase, skipIfEngineNotAvailable
@@ -88,6 +88,28 @@ class TestModel(TestCase):
             self.assertNotEqual(problem_clone_2, problem)
             self.assertNotEqual(problem, problem_clone_2)
 
+    def test_clone_action_copy_on_write(self):
+        x = Fluent("x")
+        y = Fluent("y")
+        a = InstantaneousAction("a")
+        a.add_precondition(x)
+        a.add_effect(y, True)
+
+        # mutating the clone's effects must not touch the original
+        b = a.clone()
+        self.assertEqual(a, b)
+        b.add_effect(x, False)
+        self.assertEqual(len(a.effects), 1)
+        self.assertEqual(len(b.effects), 2)
+        self.assertNotEqual(a, b)
+
+        # and modifying an Effect exposed by the clone's accessor must
+        # not leak into the original either
+        c = a.clone()
+        c.effects[0].set_value(a.environment.expression_manager.FALSE())
+        self.assertNotEqual(a.effects[0].value, c.effects[0].value)
+        self.assertEqual(a, a.clone())
+
     def test_clone_action(self):
         Location = UserType("Location")
         a = Action("move", l_from=Location, l_to=Location)
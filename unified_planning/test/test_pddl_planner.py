@@ -14,7 +14,7 @@
 #
 
 
-from io1 import StringIO
+from io import StringIO
 import unified_planning as up
 from unified_planning.shortcuts import *
 from unified_planning.engines import PlanGenerationResultStatus
@@ -27,7 +27,11 @@ from unified_planning.model.problem_kind import (
 from unified_planning.test import TestCase, main, skipIfEngineNotAvailable
 from unified_planning.test import skipIfNoOneshotPlannerForProblemKind
 from unified_planning.test.examples import get_example_problems
-from unified_planning.engines import PlanGenerationResultStatus, CompilationKind
+from unified_planning.engines import (
+    PlanGenerationResult,
+    PlanGenerationResultStatus,
+    CompilationKind,
+)
 from unified_planning.engines.results import POSITIVE_OUTCOMES
 from unified_planning.exceptions import UPUsageError
 from unified_planning.model.metrics import MinimizeSequentialPlanLength
@@ -289,6 +293,26 @@ class TestPlanner(TestCase):
             plan = planner.solve(problem).plan
             self.assertIsNotNone(plan)
 
+    def test_result_status_plan_consistency(self):
+        # A positive outcome requires a plan and a negative outcome forbids one
+        empty_plan = up.plans.SequentialPlan([])
+        with self.assertRaises(UPUsageError) as e:
+            PlanGenerationResult(
+                PlanGenerationResultStatus.SOLVED_SATISFICING, None, "engine"
+            )
+        self.assertIn("SOLVED_SATISFICING", str(e.exception))
+        with self.assertRaises(UPUsageError) as e:
+            PlanGenerationResult(
+                PlanGenerationResultStatus.UNSOLVABLE_PROVEN, empty_plan, "engine"
+            )
+        self.assertIn("UNSOLVABLE_PROVEN", str(e.exception))
+        # consistent combinations still construct normally
+        PlanGenerationResult(
+            PlanGenerationResultStatus.SOLVED_SATISFICING, empty_plan, "engine"
+        )
+        PlanGenerationResult(PlanGenerationResultStatus.UNSOLVABLE_PROVEN, None, "engine")
+        PlanGenerationResult(PlanGenerationResultStatus.TIMEOUT, None, "engine")
+
 
 if __name__ == "__main__":
     main()
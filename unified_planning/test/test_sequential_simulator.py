@@ -51,7 +51,7 @@ class TestSimulator(TestCase):
         # ts_2
         # ts_3, check clear fluent in the state.
         Location = problem.user_type("Location")
-        clear_check = [block_2, ts_2, ts_3]
+        clear_check = frozenset([block_2, ts_2, ts_3])
         for o in problem.objects(Location):
             if o in clear_check:
                 self.assertEqual(state.get_value(clear(o)), em.TRUE())
@@ -103,7 +103,7 @@ class TestSimulator(TestCase):
         )  # If the state is None it means the action was not applicable
         # now we check that the state is what we desired
         Movable = problem.user_type("Movable")
-        check_on = [(block_1, ts_1), (block_2, ts_2), (block_3, ts_3)]
+        check_on = frozenset([(block_1, ts_1), (block_2, ts_2), (block_3, ts_3)])
         for obj_tuple in product(problem.objects(Movable), problem.objects(Location)):
             if obj_tuple in check_on:
                 self.assertEqual(state.get_value(on(*obj_tuple)), em.TRUE())
@@ -237,6 +237,33 @@ class TestSimulator(TestCase):
             test_state = simulator.apply(ti, new_state)
             self.assertIsNotNone(test_state)
 
+    def test_apply_assume_applicable(self):
+        pre = Fluent("pre")
+        post = Fluent("post")
+
+        act = InstantaneousAction("act")
+        act.add_precondition(pre)
+        act.add_effect(post, True)
+
+        problem = Problem("test_apply_assume_applicable")
+        problem.add_fluent(pre, default_initial_value=False)
+        problem.add_fluent(post, default_initial_value=False)
+        problem.add_action(act)
+
+        with Simulator(problem=problem) as simulator:
+            em = problem.environment.expression_manager
+            init = UPCOWState(problem.initial_values)
+            act_ev = simulator.get_events(act, tuple())[0]
+
+            # the precondition does not hold, so the checked apply refuses
+            self.assertFalse(simulator.is_applicable(act_ev, init))
+            self.assertIsNone(simulator.apply(act_ev, init))
+
+            # assume_applicable=True skips the check, like apply_unsafe
+            assumed_state = simulator.apply(act_ev, init, assume_applicable=True)
+            self.assertIsNotNone(assumed_state)
+            self.assertEqual(assumed_state.get_value(FluentExp(post)), em.TRUE())
+
     def test_add_after_delete(self):
         bf = Fluent("bool_fluent")
 